@@ -8,17 +8,25 @@ from __future__ import annotations
 
 import json
 import math
+import os
 import sys
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 import argparse
+from collections import OrderedDict, deque
 from pathlib import Path
 from threading import Lock
-from typing import Callable, Dict, List, Optional, Sequence, Tuple, Set
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple, Set
 from typing import Dict, List, Optional, Sequence, Tuple
 
 from pynput import mouse, keyboard
-from PySide6.QtCore import QObject, QPointF, QTimer, Qt, Signal
+
+try:  # optional fast JSON parser; the stdlib module is the fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+from PySide6.QtCore import QPointF, QTimer, Qt
 from PySide6.QtGui import (
     QAction,
     QColor,
@@ -30,6 +38,7 @@ from PySide6.QtGui import (
     QPen,
     QFont,
     QPixmap,
+    QPolygonF,
 )
 from PySide6.QtWidgets import (
     QApplication,
@@ -49,8 +58,8 @@ from PySide6.QtWidgets import (
     QSystemTrayIcon,
 )
 from PySide6.QtCore import QSignalBlocker
-from PySide6.QtCore import QObject, QPointF, QRectF, QTimer, Qt, Signal
-from PySide6.QtGui import QColor, QCursor, QGuiApplication, QPainter, QPainterPath, QPen
+from PySide6.QtCore import QMetaObject, QPointF, QRectF, QTimer, Qt, Slot
+from PySide6.QtGui import QColor, QCursor, QGuiApplication, QPainter, QPainterPath, QPen, QRegion
 from PySide6.QtWidgets import QApplication, QWidget
 
 
@@ -114,12 +123,29 @@ DEFAULT_CONFIG: Dict[str, object] = {
 
 CONFIG_PATH = Path(__file__).with_name("config.json")
 
-
-class QuitDispatcher(QObject):
-    quit_requested = Signal()
-
-    def __init__(self, parent: Optional[QObject] = None):
-        super().__init__(parent)
+# Number of alpha levels the cursor tail segments are grouped into when drawn.
+TAIL_ALPHA_BUCKETS = 8
+# Upper bound on the QPen objects kept alive by OverlayWindow._get_pen.
+PEN_CACHE_SIZE = 256
+# Pen alphas are rounded to multiples of this before the cache lookup.
+PEN_ALPHA_STEP = 8
+# Upper bound on the pre-rendered click effect glyphs kept by OverlayWindow.
+CLICK_GLYPH_CACHE_SIZE = 128
+# Glyph sizes are rounded to this many steps per pixel before lookup.
+CLICK_GLYPH_SIZE_STEPS = 2
+# Resolution of the pulse table the right and middle click glyphs scale with.
+PULSE_LUT_SIZE = 256
+# Edge length in pixels of the rendered system tray icon.
+TRAY_ICON_SIZE = 64
+# Once nothing has been visible for IDLE_THROTTLE_DELAY seconds the update timer
+# drops to IDLE_TIMER_INTERVAL_MS until the next mouse or keyboard event.
+IDLE_THROTTLE_DELAY = 1.0
+IDLE_TIMER_INTERVAL_MS = 200
+# A press turns into a drag stroke once the cursor is this many pixels away.
+DRAG_START_DISTANCE = 10.0
+DRAG_START_DISTANCE_SQ = DRAG_START_DISTANCE * DRAG_START_DISTANCE
+# Config keys bound by the hotkey listener, in registration order.
+HOTKEY_CONFIG_KEYS = ("exit_hotkey", "toggle_paint_hotkey", "toggle_tracking_hotkey", "toggle_click_hotkey")
 
 
 def load_config(path: Path) -> Tuple[Dict[str, object], Dict[str, object]]:
@@ -132,21 +158,25 @@ def load_config(path: Path) -> Tuple[Dict[str, object], Dict[str, object]]:
             "Falling back to defaults.",
             file=sys.stderr,
         )
-        merged_defaults = _deep_merge(DEFAULT_CONFIG, {})
+        merged_defaults = _merge_config({})
         normalized_defaults = _normalize_config(merged_defaults)
         return normalized_defaults, merged_defaults
 
 
 def _load_raw_config(path: Path) -> Dict[str, object]:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
         if not isinstance(data, dict):
             raise ValueError("Top-level JSON structure must be an object.")
         return data
     except FileNotFoundError:
         return {}
     except (json.JSONDecodeError, OSError, ValueError) as exc:
+        # orjson.JSONDecodeError subclasses both json.JSONDecodeError and ValueError
         print(
             f"Warning: could not read {path}: {exc}. Using defaults.",
             file=sys.stderr,
@@ -155,80 +185,80 @@ def _load_raw_config(path: Path) -> Dict[str, object]:
 
 
 def _prepare_config(overrides: Dict[str, object]) -> Tuple[Dict[str, object], Dict[str, object]]:
-    merged = _deep_merge(DEFAULT_CONFIG, overrides)
+    merged = _merge_config(overrides)
     normalized = _normalize_config(merged)
     return normalized, merged
 
 
-def _deep_merge(base: Dict[str, object], override: Dict[str, object]) -> Dict[str, object]:
-    result: Dict[str, object] = {}
-
-    for key, value in base.items():
-        if isinstance(value, dict):
-            result[key] = _deep_merge(value, {})  # copy nested defaults
-        elif isinstance(value, list):
-            result[key] = list(value)
-        else:
-            result[key] = value
-
-    for key, value in override.items():
-        if isinstance(value, dict) and isinstance(result.get(key), dict):
-            result[key] = _deep_merge(result[key], value)
-        elif isinstance(value, list):
-            result[key] = list(value)
-        else:
-            result[key] = value
-
-    return result
+def _merge_config(override: Dict[str, object]) -> Dict[str, object]:
+    merged = {**DEFAULT_CONFIG, **override}
+    default_colors = DEFAULT_CONFIG["click_colors"]
+    override_colors = override.get("click_colors")
+    if isinstance(override_colors, dict):
+        merged["click_colors"] = {**default_colors, **override_colors}
+    elif override_colors is None:
+        merged["click_colors"] = dict(default_colors)  # never hand out the shared default
+    return merged
+
+
+_INT_CONFIG_KEYS = (
+    "update_interval_ms",
+    "cursor_ring_thickness",
+    "click_outline_thickness",
+    "drag_line_width",
+    "max_click_markers",
+    "cursor_tail_width",
+    "key_display_max_visible",
+)
+_FLOAT_CONFIG_KEYS = (
+    "persist_duration",
+    "fade_duration",
+    "cursor_ring_radius",
+    "click_radius",
+    "min_point_distance",
+    "cursor_idle_timeout",
+    "cursor_idle_fade_duration",
+    "click_effect_loop_time",
+    "click_effect_duration",
+    "click_effect_fade_duration",
+    "cursor_draw_shrink_time",
+    "cursor_tail_max_age",
+    "cursor_tail_min_distance",
+    "cursor_tail_max_length",
+    "focus_overlay_radius",
+    "focus_overlay_opacity",
+    "key_display_font_size",
+    "key_display_height",
+    "key_display_margin",
+    "key_display_spacing",
+    "key_display_padding",
+    "key_display_rise_distance",
+    "key_display_press_duration",
+    "key_display_release_duration",
+    "key_display_corner_radius",
+)
+_BOOL_CONFIG_DEFAULTS = (
+    ("enable_click_left", True),
+    ("enable_click_right", True),
+    ("enable_click_middle", True),
+    ("enable_painting", True),
+    ("enable_cursor_ring", True),
+    ("enable_cursor_tail", True),
+    ("enable_focus_overlay", True),
+    ("key_display_enabled", False),
+)
 
 
 def _normalize_config(raw: Dict[str, object]) -> Dict[str, object]:
     config = dict(raw)
-    config["update_interval_ms"] = int(config["update_interval_ms"])
-    config["persist_duration"] = float(config["persist_duration"])
-    config["fade_duration"] = float(config["fade_duration"])
-    config["cursor_ring_radius"] = float(config["cursor_ring_radius"])
-    config["cursor_ring_thickness"] = int(config["cursor_ring_thickness"])
-    config["click_radius"] = float(config["click_radius"])
-    config["click_outline_thickness"] = int(config["click_outline_thickness"])
-    config["drag_line_width"] = int(config["drag_line_width"])
-    config["min_point_distance"] = float(config["min_point_distance"])
-    config["cursor_idle_timeout"] = float(config.get("cursor_idle_timeout", 0.0))
-    config["cursor_idle_fade_duration"] = float(config.get("cursor_idle_fade_duration", 0.0))
-    config["click_effect_loop_time"] = float(config.get("click_effect_loop_time", 0.0))
-    config["click_effect_duration"] = float(config.get("click_effect_duration", 0.0))
-    config["click_effect_fade_duration"] = float(config.get("click_effect_fade_duration", 0.0))
-    config["max_click_markers"] = int(config.get("max_click_markers", 0))
-    config["cursor_draw_shrink_time"] = float(config.get("cursor_draw_shrink_time", 0.0))
-    config["cursor_tail_width"] = int(config.get("cursor_tail_width", 0))
-    config["cursor_tail_max_age"] = float(config.get("cursor_tail_max_age", 0.0))
-    config["cursor_tail_min_distance"] = float(config.get("cursor_tail_min_distance", 0.0))
-    config["cursor_tail_max_length"] = float(config.get("cursor_tail_max_length", 0.0))
-    config["enable_click_left"] = bool(config.get("enable_click_left", True))
-    config["enable_click_right"] = bool(config.get("enable_click_right", True))
-    config["enable_click_middle"] = bool(config.get("enable_click_middle", True))
-    config["enable_painting"] = bool(config.get("enable_painting", True))
-    config["enable_cursor_ring"] = bool(config.get("enable_cursor_ring", True))
-    config["enable_cursor_tail"] = bool(config.get("enable_cursor_tail", True))
-    config["enable_focus_overlay"] = bool(config.get("enable_focus_overlay", True))
-    config["focus_overlay_radius"] = float(config.get("focus_overlay_radius", 0.0))
-    config["focus_overlay_opacity"] = float(config.get("focus_overlay_opacity", 0.0))
-    config["toggle_paint_hotkey"] = _normalize_hotkey(config.get("toggle_paint_hotkey", ""))
-    config["toggle_tracking_hotkey"] = _normalize_hotkey(config.get("toggle_tracking_hotkey", ""))
-    config["toggle_click_hotkey"] = _normalize_hotkey(config.get("toggle_click_hotkey", ""))
-    config["focus_overlay_hotkey"] = _normalize_hotkey(config.get("focus_overlay_hotkey", ""))
-
-    config["key_display_enabled"] = bool(config.get("key_display_enabled", False))
-    config["key_display_font_size"] = float(config.get("key_display_font_size", 0.0))
-    config["key_display_height"] = float(config.get("key_display_height", 0.0))
-    config["key_display_margin"] = float(config.get("key_display_margin", 0.0))
-    config["key_display_spacing"] = float(config.get("key_display_spacing", 0.0))
-    config["key_display_padding"] = float(config.get("key_display_padding", 0.0))
-    config["key_display_rise_distance"] = float(config.get("key_display_rise_distance", 0.0))
-    config["key_display_press_duration"] = float(config.get("key_display_press_duration", 0.0))
-    config["key_display_release_duration"] = float(config.get("key_display_release_duration", 0.0))
-    config["key_display_max_visible"] = int(config.get("key_display_max_visible", 0))
-    config["key_display_corner_radius"] = float(config.get("key_display_corner_radius", 0.0))
+    for key in _INT_CONFIG_KEYS:
+        config[key] = int(config.get(key, 0))
+    for key in _FLOAT_CONFIG_KEYS:
+        config[key] = float(config.get(key, 0.0))
+    for key, default in _BOOL_CONFIG_DEFAULTS:
+        config[key] = bool(config.get(key, default))
+    for key in HOTKEY_CONFIG_KEYS + ("focus_overlay_hotkey",):
+        config[key] = _normalize_hotkey(config.get(key, ""))
 
     config["cursor_ring_color"] = _to_qcolor(config["cursor_ring_color"])
     config["drag_color"] = _to_qcolor(config["drag_color"])
@@ -247,9 +277,6 @@ def _normalize_config(raw: Dict[str, object]) -> Dict[str, object]:
         name: _to_qcolor(color_value) for name, color_value in click_colors_raw.items()
     }
 
-    hotkey_raw = config.get("exit_hotkey", "")
-    config["exit_hotkey"] = _normalize_hotkey(hotkey_raw)
-
     return config
 
 
@@ -271,6 +298,113 @@ def _to_qcolor(value: object) -> QColor:
     raise TypeError(f"Unsupported color specification: {value!r}")
 
 
+_KEY_LABEL_MAP: Dict[str, str] = {
+    "space": "SPACE",
+    "enter": "ENTER",
+    "return": "ENTER",
+    "esc": "ESC",
+    "escape": "ESC",
+    "shift": "SHIFT",
+    "shift_l": "SHIFT",
+    "shift_r": "SHIFT",
+    "ctrl": "CTRL",
+    "ctrl_l": "CTRL",
+    "ctrl_r": "CTRL",
+    "alt": "ALT",
+    "alt_l": "ALT",
+    "alt_r": "ALT",
+    "cmd": "CMD",
+    "cmd_l": "CMD",
+    "cmd_r": "CMD",
+    "tab": "TAB",
+    "caps_lock": "CAPS LOCK",
+    "backspace": "BACKSPACE",
+    "delete": "DEL",
+    "enter_l": "ENTER",
+    "up": "UP",
+    "down": "DOWN",
+    "left": "LEFT",
+    "right": "RIGHT",
+    "page_up": "PAGE UP",
+    "page_down": "PAGE DOWN",
+    "home": "HOME",
+    "end": "END",
+}
+
+_KEY_ALIASES = {
+    candidate: canonical
+    for candidate, canonical in (
+        (getattr(keyboard.Key, "ctrl_l", None), keyboard.Key.ctrl),
+        (getattr(keyboard.Key, "ctrl_r", None), keyboard.Key.ctrl),
+        (getattr(keyboard.Key, "shift_l", None), keyboard.Key.shift),
+        (getattr(keyboard.Key, "shift_r", None), keyboard.Key.shift),
+        (getattr(keyboard.Key, "alt_l", None), keyboard.Key.alt),
+        (getattr(keyboard.Key, "alt_r", None), keyboard.Key.alt),
+        (getattr(keyboard.Key, "cmd_l", None), getattr(keyboard.Key, "cmd", None)),
+        (getattr(keyboard.Key, "cmd_r", None), getattr(keyboard.Key, "cmd", None)),
+    )
+    if candidate is not None and canonical is not None
+}
+
+
+# Keyboards only ever produce a few dozen distinct raw keys, and pynput keys
+# are hashable, so each one is normalized once.
+@lru_cache(maxsize=512)
+def _normalise_key(key):
+    if isinstance(key, keyboard.KeyCode):
+        char = key.char.lower() if key.char else None
+        if char and char.isprintable():
+            return keyboard.KeyCode.from_char(char)
+        vk = getattr(key, "vk", None)
+        if vk is not None:
+            try:
+                derived = chr(vk).lower()
+            except (TypeError, ValueError):
+                derived = None
+            if derived and derived.isprintable():
+                return keyboard.KeyCode.from_char(derived)
+            return keyboard.KeyCode.from_vk(vk)
+    elif isinstance(key, keyboard.Key):
+        return _KEY_ALIASES.get(key, key)
+    return key
+
+
+_HOTKEY_KEY_MAP = {
+    "ctrl": keyboard.Key.ctrl,
+    "control": keyboard.Key.ctrl,
+    "shift": keyboard.Key.shift,
+    "alt": keyboard.Key.alt,
+    "option": keyboard.Key.alt,
+    "cmd": getattr(keyboard.Key, "cmd", None),
+    "command": getattr(keyboard.Key, "cmd", None),
+    "win": getattr(keyboard.Key, "cmd", None),
+    "super": getattr(keyboard.Key, "cmd", None),
+    "escape": keyboard.Key.esc,
+    "esc": keyboard.Key.esc,
+    "enter": keyboard.Key.enter,
+    "return": keyboard.Key.enter,
+    "space": keyboard.Key.space,
+}
+
+_HOTKEY_TOKEN_MAP: Dict[str, str] = {
+    "ctrl": "<ctrl>",
+    "control": "<ctrl>",
+    "shift": "<shift>",
+    "alt": "<alt>",
+    "option": "<alt>",
+    "cmd": "<cmd>",
+    "command": "<cmd>",
+    "win": "<cmd>",
+    "super": "<cmd>",
+    "esc": "escape",
+    "escape": "escape",
+    "enter": "enter",
+    "return": "enter",
+    "space": "space",
+}
+_STRIP_ANGLE_BRACKETS = str.maketrans("", "", "<>")
+
+
 def _normalize_hotkey(value: object) -> str:
     if value is None:
         return ""
@@ -280,32 +414,78 @@ def _normalize_hotkey(value: object) -> str:
             return ""
         tokens = [
             token.strip().lower()
-            for token in cleaned.replace("<", "").replace(">", "").split("+")
+            for token in cleaned.translate(_STRIP_ANGLE_BRACKETS).split("+")
             if token.strip()
         ]
         if not tokens:
             return ""
-        mapping = {
-            "ctrl": "<ctrl>",
-            "control": "<ctrl>",
-            "shift": "<shift>",
-            "alt": "<alt>",
-            "option": "<alt>",
-            "cmd": "<cmd>",
-            "command": "<cmd>",
-            "win": "<cmd>",
-            "super": "<cmd>",
-            "esc": "escape",
-            "escape": "escape",
-            "enter": "enter",
-            "return": "enter",
-            "space": "space",
-        }
-        formatted = [mapping.get(token, token) for token in tokens]
+        formatted = [_HOTKEY_TOKEN_MAP.get(token, token) for token in tokens]
         return "+".join(formatted)
     raise TypeError("exit_hotkey must be defined as a string.")
 
 
+@lru_cache(maxsize=64)
+def _format_hotkey(spec: str) -> str:
+    """Return the control panel label for a normalized hotkey spec."""
+    if not spec:
+        return ""
+    parts = [p.strip() for p in spec.translate(_STRIP_ANGLE_BRACKETS).split("+") if p.strip()]
+    if not parts:
+        return ""
+    return "+".join(part.upper() if len(part) == 1 else part.capitalize() for part in parts)
+
+
+def _click_phase(
+    now: float,
+    created_at: float,
+    loop_time: float,
+    duration: float,
+    release_at: Optional[float],
+    fade: float,
+    active: bool,
+) -> Tuple[float, float, bool]:
+    """Return (progress, strength, completed) for a click effect at ``now``."""
+    progress = (max(0.0, now - created_at) / max(1e-6, loop_time)) % 1.0
+    if active:
+        # Held buttons are the common case and never fade.
+        return progress, 1.0, False
+
+    duration = max(0.0, duration)
+    release_time = created_at if release_at is None else release_at
+    release_elapsed = max(0.0, now - release_time)
+    if release_elapsed <= duration:
+        return progress, 1.0, False
+    if fade > 0.0 and release_elapsed <= (duration + fade):
+        fade_elapsed = release_elapsed - duration
+        return progress, max(0.0, 1.0 - (fade_elapsed / fade)), False
+    return progress, 0.0, True
+
+
+def _click_phase_completed(
+    now: float,
+    created_at: float,
+    duration: float,
+    release_at: Optional[float],
+    fade: float,
+    active: bool,
+) -> bool:
+    """Return only the ``completed`` flag of :func:`_click_phase`, without the loop progress."""
+    if active:
+        return False
+    release_time = created_at if release_at is None else release_at
+    return (now - release_time) > max(0.0, duration) + max(0.0, fade)
+
+
+_PULSE_LUT = tuple(1.0 + 0.2 * math.sin(math.pi * i / PULSE_LUT_SIZE) for i in range(PULSE_LUT_SIZE))
+
+
+def _alpha_scale(age: float, persist: float, fade: float) -> float:
+    if fade <= 0.0:
+        return 0.0 if age > persist else 1.0
+    # Clamping covers both the full-strength window and the expired case.
+    return max(0.0, min(1.0, (persist - age) / fade))
+
+
 CONTROL_PANEL_STYLE = """
 QWidget {
     background-color: #121212;
@@ -375,88 +555,136 @@ QPushButton[danger="true"]:pressed {
 }
 """
 
+# slots=True needs Python 3.10; on 3.9 the dataclasses keep a __dict__.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+# Markers are tracked by identity (press bookkeeping, deque membership), so
+# field-wise equality is turned off.
+@dataclass(eq=False, **_DATACLASS_OPTIONS)
 class ClickMarker:
     position: QPointF
     color: QColor
     button: str
     loop_time: float
     duration: float
-    created_at: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=time.monotonic)
     release_at: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Stroke:
-    points: List[QPointF]
+    points: QPolygonF  # contiguous Qt point buffer; no Python object per sample
     color: QColor
-    created_at: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=time.monotonic)
     active: bool = True
-
-
-@dataclass
+    last_x: float = 0.0
+    last_y: float = 0.0
+    # Running bounding box of the samples, used for the repaint region.
+    min_x: float = math.inf
+    min_y: float = math.inf
+    max_x: float = -math.inf
+    max_y: float = -math.inf
+    # Full-strength raster of a completed stroke, keyed by (device pixel ratio, width).
+    pixmap: Optional[QPixmap] = None
+    pixmap_origin: Optional[QPointF] = None
+    pixmap_key: Optional[Tuple[float, int]] = None
+
+    def add_point(self, x: float, y: float):
+        self.points.append(QPointF(x, y))
+        self.last_x = x
+        self.last_y = y
+        if x < self.min_x:
+            self.min_x = x
+        if x > self.max_x:
+            self.max_x = x
+        if y < self.min_y:
+            self.min_y = y
+        if y > self.max_y:
+            self.max_y = y
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class KeyIndicator:
     identifier: str
     label: str
     pressed_at: float
     released_at: Optional[float] = None
 
-    def copy(self) -> KeyIndicator:
-        return KeyIndicator(
-            identifier=self.identifier,
-            label=self.label,
-            pressed_at=self.pressed_at,
-            released_at=self.released_at,
-        )
-
 
 class OverlayWindow(QWidget):
     def __init__(self, config: dict, raw_config: dict, config_path: Path):
         super().__init__()
         self.config_path = config_path
         self._lock = Lock()
-        self._quit_dispatcher = QuitDispatcher(self)
-        self._quit_dispatcher.quit_requested.connect(self._quit_app)
+        self._timer_throttled = False
+        self._idle_since: Optional[float] = None
+        self._painted_region = QRegion()
 
         self.virtual_geometry = self._compute_virtual_geometry()
+        # Plain floats so _global_to_local does not call into Qt per mouse event.
+        self._origin_x = float(self.virtual_geometry.x())
+        self._origin_y = float(self.virtual_geometry.y())
         self._init_window()
 
-        self.cursor_pos = QPointF(0, 0)
-        self.click_initial_position = QPointF(0, 0)
-        self.click_markers: List[ClickMarker] = []
-        self.completed_strokes: List[Stroke] = []
+        # Seeded once from Qt; afterwards only the pynput move callback updates it.
+        start_pos = QCursor.pos()
+        # Local positions are kept as (x, y) floats; QPointF is only built where
+        # Qt needs one (stroke buffers, click markers, the per-frame cursor).
+        self.cursor_pos: Tuple[float, float] = self._global_to_local(start_pos.x(), start_pos.y())
+        self.click_initial_position: Tuple[float, float] = (0.0, 0.0)
+        self.click_markers: Deque[ClickMarker] = deque()
+        # Appended on release, so oldest first by created_at.
+        self.completed_strokes: Deque[Stroke] = deque()
         self.active_stroke: Optional[Stroke] = None
 
         self.left_button_down = False
         self._hotkey_listener: Optional[keyboard.Listener] = None
+        self._hotkey_listener_signature: Optional[tuple] = None
+        self._hotkey_combos: Dict[str, frozenset] = {}
         self._shutdown_requested = False
-        self._last_cursor_global: Optional[tuple[int, int]] = None
-        self._cursor_last_moved = time.time()
+        self._last_cursor_global: Optional[tuple[float, float]] = None
+        self._cursor_last_moved = time.monotonic()
+        self._now = 0.0
         self._left_press_time: Optional[float] = None
         self.button_down = {"left": False, "right": False, "middle": False}
         self._press_markers: Dict[str, Optional[ClickMarker]] = {"left": None, "right": None, "middle": None}
-        self.cursor_tail: List[tuple[float, QPointF]] = []
+        # (timestamp, x, y) samples; plain float tuples so snapshots are a shallow copy
+        self.cursor_tail: Deque[tuple[float, float, float]] = deque()
+        self._cursor_tail_length = 0.0  # summed segment length of cursor_tail
         self.config: Dict[str, object] = {}
         self.raw_config: Dict[str, object] = {}
+        self._raw_config_text: Optional[str] = None
         self.effect_flags: Dict[str, bool] = {}
         self._runtime_initialized = False
         self.focus_overlay_active = False
-        self._focus_hotkey_set: Set = set()
+        self._focus_hotkey_set: frozenset = frozenset()
         self._pressed_keys: Set = set()
         self._hotkey_bindings: Dict[frozenset, Callable] = {}
+        # Every key of every bound combo, mapped to the bindings it belongs to.
+        self._hotkeys_by_key: Dict[object, List[Tuple[frozenset, Callable]]] = {}
         self._active_hotkeys: Set[frozenset] = set()
+        # Filled by the hotkey listener thread and drained on the GUI thread.
+        self._pending_hotkey_handlers: Deque[Callable] = deque()
 
         self._apply_config(config, raw_config, reset_runtime=True)
         self.control_panel: Optional[QWidget] = None
-        self._cursor_tail_min_distance_sq = float(self.config["cursor_tail_min_distance"]) ** 2
+        self.app: Optional[QApplication] = None
+        self._pen_cache: "OrderedDict[Tuple[int, int, Qt.PenCapStyle], QPen]" = OrderedDict()
+        # Re-tinted per ring by the left-click ripple; pens copy the color they are
+        # given, and click effects are only drawn on the GUI thread.
+        self._click_scratch_color = QColor()
+        self._click_glyph_cache: "OrderedDict[Tuple[object, ...], QPixmap]" = OrderedDict()
+        self._focus_hole_cache: Optional[Tuple[Tuple[float, int, float], QPixmap]] = None
+        self._click_draw_dispatch: Dict[str, Callable[..., None]] = {
+            "left": self._draw_left_click_ripple,
+            "right": self._draw_right_click_corners,
+            "middle": self._draw_middle_click_cross,
+        }
         self._key_listener: Optional[keyboard.Listener] = None
-        self._active_keys: Dict[str, KeyIndicator] = {}
-        self._key_display_order: List[str] = []
+        # Insertion order is display order; a repeated press moves the key to the end.
+        self._active_keys: "OrderedDict[str, KeyIndicator]" = OrderedDict()
         self._key_display_enabled = bool(self.config.get("key_display_enabled", False))
-        self._key_press_duration = float(self.config.get("key_display_press_duration", 0.0))
-        self._key_release_duration = float(self.config.get("key_display_release_duration", 0.0))
-        self._key_max_visible = int(self.config.get("key_display_max_visible", 0))
 
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._on_timer_tick)
@@ -468,7 +696,6 @@ class OverlayWindow(QWidget):
         )
         self._listener.start()
         self._start_key_listener()
-        self._start_hotkey_listener()
 
     def _compute_virtual_geometry(self):
         screens = QGuiApplication.screens()
@@ -489,120 +716,217 @@ class OverlayWindow(QWidget):
         self.setWindowFlag(Qt.WindowStaysOnTopHint)
         self.setWindowFlag(Qt.Tool)  # Hide from taskbar
 
-    def _global_to_local(self, x: float, y: float) -> QPointF:
-        return QPointF(
-            x - self.virtual_geometry.x(),
-            y - self.virtual_geometry.y(),
-        )
+    def _global_to_local(self, x: float, y: float) -> Tuple[float, float]:
+        return (x - self._origin_x, y - self._origin_y)
 
     def _on_timer_tick(self):
-        global_pos = QCursor.pos()
-        coords = (global_pos.x(), global_pos.y())
-        now = time.time()
+        now = time.monotonic()
+        self._now = now
         with self._lock:
-            if self._last_cursor_global != coords:
-                self._last_cursor_global = coords
-                self._cursor_last_moved = now
-            self.cursor_pos = self._global_to_local(coords[0], coords[1])
-            self._update_cursor_tail(now)
-            self._prune_expired_artifacts()
-        self.update()
+            tail = self.cursor_tail
+            # Samples are appended on move; between moves the tail only changes
+            # when its oldest sample ages out or a drag is shrinking the length limit.
+            if tail and (
+                (now - tail[0][0]) > self._cursor_tail_max_age or self.active_stroke is not None
+            ):
+                self._trim_cursor_tail(now)
+            self._prune_expired_artifacts(now)
+            visible = self._has_visible_content(now)
+            region = self._content_region(now) if visible else QRegion()
+
+        if visible:
+            self._idle_since = None
+            self._repaint_region(region)
+            return
+        if self._idle_since is None:
+            # One more frame clears whatever was drawn last.
+            self._idle_since = now
+            self._repaint_region(QRegion())
+        elif not self._timer_throttled and (now - self._idle_since) > IDLE_THROTTLE_DELAY:
+            self._timer_throttled = True
+            self._timer.setInterval(IDLE_TIMER_INTERVAL_MS)
+
+    def _has_visible_content(self, now: float) -> bool:
+        if self.click_markers or self.completed_strokes or self.cursor_tail:
+            return True
+        if self.active_stroke is not None or self.focus_overlay_active:
+            return True
+        if self._key_display_enabled and self._active_keys:
+            return True
+        return self._cursor_ring_enabled and self._cursor_idle_alpha(now) > 0.0
+
+    def _content_region(self, now: float) -> QRegion:
+        """Return the area the next frame can draw into; empty if it draws nothing."""
+        if self.focus_overlay_active:
+            return QRegion(self.rect())
+
+        # Each element contributes its own rectangle, so a cursor and a marker on
+        # opposite corners do not dirty everything between them.
+        region = QRegion()
+
+        def add(left: float, top: float, right: float, bottom: float):
+            nonlocal region
+            region = region.united(QRectF(left, top, right - left, bottom - top).toAlignedRect())
+
+        if self._key_display_enabled and self._active_keys:
+            strip_top = self._key_strip_top
+            if strip_top is None:
+                return QRegion(self.rect())
+            add(0.0, strip_top, self.width(), self.height())
+
+        if self._cursor_ring_enabled and self._cursor_idle_alpha(now) > 0.0:
+            x, y = self.cursor_pos
+            extent = self._cursor_ring_radius + self._cursor_ring_thickness + 2.0
+            add(x - extent, y - extent, x + extent, y + extent)
+
+        if self.cursor_tail:
+            # Every sample lies within the tail's path length of the newest one.
+            _, x, y = self.cursor_tail[-1]
+            extent = self._cursor_tail_length + self._cursor_tail_width + 4.0
+            add(x - extent, y - extent, x + extent, y + extent)
+
+        if self.click_markers:
+            # The left-click ripple reaches furthest, at about 2.5x click_radius.
+            extent = self._click_radius * 2.6 + self._click_outline_width + 2.0
+            for marker in self.click_markers:
+                x = marker.position.x()
+                y = marker.position.y()
+                add(x - extent, y - extent, x + extent, y + extent)
+
+        extent = self._drag_line_width + 2.0
+        strokes = self.completed_strokes
+        if self.active_stroke is not None:
+            strokes = list(strokes)
+            strokes.append(self.active_stroke)
+        for stroke in strokes:
+            if stroke.min_x <= stroke.max_x:
+                add(stroke.min_x - extent, stroke.min_y - extent, stroke.max_x + extent, stroke.max_y + extent)
+
+        return region
+
+    def _repaint_region(self, region: QRegion):
+        # Repaint what this frame draws plus what the previous one drew, so
+        # anything that moved or vanished is cleared from the backing store.
+        dirty = region.united(self._painted_region)
+        self._painted_region = region
+        if not dirty.isEmpty():
+            self.update(dirty)
+
+    def _note_activity(self):
+        # Called from the listener threads; the timer itself is only touched on
+        # the GUI thread, by the _wake_timer slot invoked with a queued connection.
+        if self._timer_throttled:
+            QMetaObject.invokeMethod(self, "_wake_timer", Qt.QueuedConnection)
+
+    def _request_repaint(self):
+        # All painting is batched on the update timer, which repaints on its next
+        # tick whenever something is visible or was visible on the previous one.
+        # This only makes sure the timer is not throttled, and avoids calling
+        # QWidget.update() from the listener threads.
+        self._note_activity()
+
+    @Slot()
+    def _wake_timer(self):
+        self._idle_since = None
+        if self._timer_throttled:
+            self._timer_throttled = False
+            self._timer.setInterval(int(self.config["update_interval_ms"]))
 
-    def _prune_expired_artifacts(self):
-        now = time.time()
-        persist = self.config["persist_duration"]
+    def _prune_expired_artifacts(self, now: float):
+        persist = self._persist_duration
 
-        self.click_markers = [
-            marker
-            for marker in self.click_markers
-            if self._click_marker_visible(marker, now)
-        ]
+        self._filter_click_markers(lambda marker: self._click_marker_visible(marker, now))
 
-        self.completed_strokes = [
-            stroke
-            for stroke in self.completed_strokes
-            if (now - stroke.created_at) <= persist
-        ]
+        strokes = self.completed_strokes
+        while strokes and (now - strokes[0].created_at) > persist:
+            strokes.popleft()
 
         if self._key_display_enabled:
             self._prune_inactive_keys_locked(now)
 
     def _on_move(self, x: float, y: float):
-        if not self.effect_flags.get("enable_painting", True):
+        point = self._global_to_local(x, y)
+        now = time.monotonic()
+        with self._lock:
+            self._last_cursor_global = (x, y)
+            self.cursor_pos = point
+            self._cursor_last_moved = now
+            self._update_cursor_tail(now)
+        self._note_activity()
+
+        if not self._painting_enabled:
             return
         if not self.left_button_down:
             return
-        point = self._global_to_local(x, y)
-        diff = point - self.click_initial_position
+        local_x, local_y = point
+        start_x, start_y = self.click_initial_position
         with self._lock:
             if not self.active_stroke:
-                if(abs(diff.x()) > 10 or abs(diff.y()) > 10):
-                    stroke_color = QColor(self.config["drag_color"])
-                    stroke = Stroke(points=[point], color=stroke_color)
+                dx = local_x - start_x
+                dy = local_y - start_y
+                if dx * dx + dy * dy > DRAG_START_DISTANCE_SQ:
+                    stroke_color = QColor(self._drag_color)
+                    stroke = Stroke(points=QPolygonF(), color=stroke_color)
+                    stroke.add_point(local_x, local_y)
                     self.active_stroke = stroke
-                    self._left_press_time = time.time()
+                    self._left_press_time = now
                     current_marker = self._press_markers.get("left")
                     if current_marker and current_marker in self.click_markers:
                         self.click_markers.remove(current_marker)
                     self._press_markers["left"] = None
                 else:
                     return
-            self._append_point_to_active_stroke(point)
+            self._append_point_to_active_stroke(local_x, local_y)
 
     def _on_click(self, x: float, y: float, button, pressed: bool):
+        self._note_activity()
         button_name = self._button_name(button)
         if not button_name:
             return
 
         position = self._global_to_local(x, y)
-        now = time.time()
+        now = time.monotonic()
         if pressed:
-            with self._lock:
-                self.button_down[button_name] = True
-            if button_name == "left":
-                if self.effect_flags.get("enable_painting", True):
-                    with self._lock:
-                        self.left_button_down = True
-                        self._left_press_time = now
-                else:
-                    with self._lock:
-                        self.left_button_down = False
-                        self._left_press_time = None
-            if not self.active_stroke:
-                self.click_initial_position = position
-            if self._is_click_enabled(button_name):
-                marker_color = self.config["click_colors"].get(button_name)
+            # Build the marker first so all press state is committed in one
+            # critical section and a frame never sees it half applied.
+            marker = None
+            click_enabled = self._is_click_enabled(button_name)
+            if click_enabled:
+                marker_color = self._click_colors.get(button_name)
                 if marker_color:
-                    duration = self._click_effect_duration(button_name)
-                    loop_time = self._click_effect_loop_time(button_name)
                     marker = ClickMarker(
-                        position=position,
+                        position=QPointF(position[0], position[1]),
                         color=QColor(marker_color),
                         button=button_name,
-                        loop_time=loop_time,
-                        duration=duration,
+                        loop_time=self._click_effect_loop_time(button_name),
+                        duration=self._click_effect_duration(button_name),
                     )
-                    with self._lock:
-                        self.click_markers.append(marker)
-                        self._enforce_click_marker_limit()
-                        self._press_markers[button_name] = marker
-            else:
-                with self._lock:
+            with self._lock:
+                self.button_down[button_name] = True
+                if button_name == "left":
+                    painting = self._painting_enabled
+                    self.left_button_down = painting
+                    self._left_press_time = now if painting else None
+                if not self.active_stroke:
+                    self.click_initial_position = position
+                if marker is not None:
+                    self._append_click_marker_locked(marker)
+                    self._press_markers[button_name] = marker
+                elif not click_enabled:
                     self._press_markers[button_name] = None
         else:
-            self.click_initial_position = QPointF(0, 0)
-            if button_name == "left":
-                with self._lock:
+            with self._lock:
+                self.click_initial_position = (0.0, 0.0)
+                if button_name == "left":
                     self.left_button_down = False
                     self._left_press_time = None
-                    if self.effect_flags.get("enable_painting", True) and self.active_stroke:
-                        self._append_point_to_active_stroke(position)
-                        if len(self.active_stroke.points) > 1:
+                    if self._painting_enabled and self.active_stroke:
+                        self._append_point_to_active_stroke(position[0], position[1])
+                        if self.active_stroke.points.size() > 1:
                             self.active_stroke.active = False
-                            self.active_stroke.created_at = time.time()
+                            self.active_stroke.created_at = now
                             self.completed_strokes.append(self.active_stroke)
                     self.active_stroke = None
-            with self._lock:
                 self.button_down[button_name] = False
                 self._mark_button_released(button_name, now)
 
@@ -619,36 +943,38 @@ class OverlayWindow(QWidget):
             return None
         return None
 
-    def _on_key_press(self, key):
+    # The key display has its own listener; _on_key_press/_on_key_release are
+    # the hotkey listener's callbacks.
+    def _on_key_display_press(self, key):
         if not self._key_display_enabled:
             return
+        self._note_activity()
         identifier = self._key_identifier(key)
         if not identifier:
             return
         label = self._key_label(key)
         if not label:
             return
-        now = time.time()
+        now = time.monotonic()
         with self._lock:
             indicator = self._active_keys.get(identifier)
             if indicator:
                 indicator.pressed_at = now
                 indicator.released_at = None
+                self._active_keys.move_to_end(identifier)
             else:
                 indicator = KeyIndicator(identifier=identifier, label=label, pressed_at=now)
                 self._active_keys[identifier] = indicator
-            if identifier in self._key_display_order:
-                self._key_display_order.remove(identifier)
-            self._key_display_order.append(identifier)
             self._enforce_key_limit_locked()
 
-    def _on_key_release(self, key):
+    def _on_key_display_release(self, key):
         if not self._key_display_enabled:
             return
+        self._note_activity()
         identifier = self._key_identifier(key)
         if not identifier:
             return
-        now = time.time()
+        now = time.monotonic()
         with self._lock:
             indicator = self._active_keys.get(identifier)
             if not indicator:
@@ -687,40 +1013,9 @@ class OverlayWindow(QWidget):
             name = getattr(key, "name", "") or str(key)
             if name.startswith("Key."):
                 name = name[4:]
-            mapping = {
-                "space": "SPACE",
-                "enter": "ENTER",
-                "return": "ENTER",
-                "esc": "ESC",
-                "escape": "ESC",
-                "shift": "SHIFT",
-                "shift_l": "SHIFT",
-                "shift_r": "SHIFT",
-                "ctrl": "CTRL",
-                "ctrl_l": "CTRL",
-                "ctrl_r": "CTRL",
-                "alt": "ALT",
-                "alt_l": "ALT",
-                "alt_r": "ALT",
-                "cmd": "CMD",
-                "cmd_l": "CMD",
-                "cmd_r": "CMD",
-                "tab": "TAB",
-                "caps_lock": "CAPS LOCK",
-                "backspace": "BACKSPACE",
-                "delete": "DEL",
-                "enter_l": "ENTER",
-                "up": "UP",
-                "down": "DOWN",
-                "left": "LEFT",
-                "right": "RIGHT",
-                "page_up": "PAGE UP",
-                "page_down": "PAGE DOWN",
-                "home": "HOME",
-                "end": "END",
-            }
-            if name in mapping:
-                return mapping[name]
+            label = _KEY_LABEL_MAP.get(name)
+            if label:
+                return label
             return name.replace("_", " ").upper()
         text = str(key)
         if text.startswith("Key."):
@@ -731,94 +1026,119 @@ class OverlayWindow(QWidget):
         limit = self._key_max_visible
         if limit <= 0:
             return
-        while len(self._key_display_order) > limit:
-            candidate = None
-            for key_id in self._key_display_order:
-                indicator = self._active_keys.get(key_id)
-                if indicator and indicator.released_at is not None:
-                    candidate = key_id
-                    break
+        keys = self._active_keys
+        while len(keys) > limit:
+            # Prefer evicting the oldest released key, then the oldest held one.
+            candidate = next(
+                (key_id for key_id, indicator in keys.items() if indicator.released_at is not None),
+                None,
+            )
             if candidate is None:
-                candidate = self._key_display_order[0]
-            if candidate in self._active_keys:
-                del self._active_keys[candidate]
-            self._key_display_order = [key_id for key_id in self._key_display_order if key_id != candidate]
+                keys.popitem(last=False)
+            else:
+                del keys[candidate]
 
     def _prune_inactive_keys_locked(self, now: float):
-        if not self._key_display_order:
+        keys = self._active_keys
+        if not keys:
             return
-        release_duration = self._key_release_duration
-        keep_order: List[str] = []
-        for key_id in self._key_display_order:
-            indicator = self._active_keys.get(key_id)
-            if not indicator:
-                continue
-            if indicator.released_at is not None:
-                elapsed = now - indicator.released_at
-                if release_duration <= 0.0 and elapsed >= 0.0:
-                    del self._active_keys[key_id]
-                    continue
-                if release_duration > 0.0 and elapsed >= release_duration:
-                    del self._active_keys[key_id]
-                    continue
-            keep_order.append(key_id)
-        self._key_display_order = keep_order
+        linger = max(0.0, self._key_release_duration)
+        expired = [
+            key_id
+            for key_id, indicator in keys.items()
+            if indicator.released_at is not None and (now - indicator.released_at) >= linger
+        ]
+        for key_id in expired:
+            del keys[key_id]
 
     def paintEvent(self, event):
+        # Frames share the timestamp of the tick that scheduled them; paints
+        # triggered before the first tick fall back to the clock.
+        now = self._now or time.monotonic()
+        # Unlocked read: a sample appended meanwhile is picked up by the next tick.
+        if not self._has_visible_content(now):
+            return
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
+        persist = self._persist_duration
+        fade = self._fade_window
 
-        now = time.time()
-        persist = self.config["persist_duration"]
-        fade = max(0.0, min(self.config["fade_duration"], persist))
+        # The cursor position is only ever rebound (never mutated) and the tail is
+        # copied with a single list() call, so neither needs the listener lock.
+        cursor_pos = QPointF(*self.cursor_pos)
+        cursor_tail_snapshot = list(self.cursor_tail)
 
+        # Hold the lock only for shallow copies of state the listener threads write.
         with self._lock:
-            cursor_pos = QPointF(self.cursor_pos)
-            cursor_tail_snapshot = [(ts, QPointF(point)) for ts, point in self.cursor_tail]
             click_markers_snapshot = list(self.click_markers)
             strokes_snapshot = list(self.completed_strokes)
-            active_stroke = self.active_stroke.points.copy() if self.active_stroke else None
-            active_color = QColor(self.active_stroke.color) if self.active_stroke else None
+            # QPolygonF copies are implicitly shared, so this does not copy the points.
+            # A stroke's color is fixed when it starts, so it is read without a copy.
+            active_stroke = QPolygonF(self.active_stroke.points) if self.active_stroke else None
+            active_color = self.active_stroke.color if self.active_stroke else None
             key_indicators_snapshot = (
                 [
-                    self._active_keys[key_id].copy()
-                    for key_id in self._key_display_order
-                    if key_id in self._active_keys
+                    (indicator.label, indicator.pressed_at, indicator.released_at)
+                    for indicator in self._active_keys.values()
                 ]
                 if self._key_display_enabled
                 else []
             )
+            # Shared by the ring and the tail; read here so both see the same drag state.
+            draw_progress = self._draw_mode_progress(now)
 
-        self._draw_cursor_tail(painter, cursor_tail_snapshot, now)
+        self._draw_cursor_tail(painter, cursor_tail_snapshot, now, draw_progress)
         self._draw_focus_overlay(painter, cursor_pos)
-        self._draw_cursor_ring(painter, cursor_pos, now, click_markers_snapshot)
-        self._draw_click_effects(painter, click_markers_snapshot, now)
+        click_phases = self._click_effect_phases(click_markers_snapshot, now)
+        ring_alpha = self._cursor_idle_alpha(now)
+        self._draw_cursor_ring(painter, cursor_pos, ring_alpha, draw_progress, click_phases)
+        self._draw_click_effects(painter, click_phases)
         self._draw_strokes(painter, strokes_snapshot, now, persist, fade)
-        if active_stroke:
+        if active_stroke is not None:
             self._draw_active_stroke(painter, active_stroke, active_color)
         self._draw_key_indicators(painter, key_indicators_snapshot, now)
 
+    def _get_pen(self, color: QColor, width: int, cap: Qt.PenCapStyle = Qt.SquareCap) -> QPen:
+        # Fading effects ask for a new alpha every frame; rounding it to steps of
+        # PEN_ALPHA_STEP lets those frames share pens instead of churning the cache.
+        rgba = color.rgba()
+        alpha = min(255, ((rgba >> 24) + PEN_ALPHA_STEP // 2) // PEN_ALPHA_STEP * PEN_ALPHA_STEP)
+        rgba = (alpha << 24) | (rgba & 0xFFFFFF)
+        key = (rgba, width, cap)
+        cache = self._pen_cache
+        pen = cache.get(key)
+        if pen is not None:
+            cache.move_to_end(key)
+            return pen
+        pen = QPen(QColor.fromRgba(rgba))
+        pen.setWidth(width)
+        pen.setCapStyle(cap)
+        cache[key] = pen
+        if len(cache) > PEN_CACHE_SIZE:
+            cache.popitem(last=False)
+        return pen
+
     def _draw_cursor_ring(
         self,
         painter: QPainter,
         position: QPointF,
-        now: float,
-        markers: List[ClickMarker],
+        alpha_scale: float,
+        draw_progress: float,
+        phases: List[Tuple[ClickMarker, float, float, bool]],
     ):
-        if not self.effect_flags.get("enable_cursor_ring", True):
+        if not self._cursor_ring_enabled:
             return
 
-        alpha_scale = self._cursor_idle_alpha(now)
         if alpha_scale <= 0.0:
             return
 
-        draw_progress = self._draw_mode_progress(now)
-        fade_factor = self._ring_effect_fade(markers, now)
-        color = QColor(self.config["cursor_ring_color"])
+        fade_factor = self._ring_effect_fade(phases)
+        color = QColor(self._cursor_ring_color)
         color.setAlpha(int(color.alpha() * alpha_scale * fade_factor))
 
-        base_radius = self.config["cursor_ring_radius"]
-        base_thickness = self.config["cursor_ring_thickness"]
+        base_radius = self._cursor_ring_radius
+        base_thickness = self._cursor_ring_thickness
 
         radius = base_radius
         thickness = base_thickness
@@ -831,8 +1151,7 @@ class OverlayWindow(QWidget):
             radius = max(4.0, base_radius * 0.55)
             thickness = max(1, int(base_thickness * 0.6))
 
-        pen = QPen(color)
-        pen.setWidth(thickness)
+        pen = self._get_pen(color, thickness)
         painter.setPen(pen)
         painter.setBrush(Qt.NoBrush)
         painter.drawEllipse(position, radius, radius)
@@ -850,47 +1169,68 @@ class OverlayWindow(QWidget):
             painter.setPen(Qt.NoPen)
             painter.setBrush(Qt.NoBrush)
 
-    def _draw_cursor_tail(self, painter: QPainter, samples: List[tuple[float, QPointF]], now: float):
-        if not self.effect_flags.get("enable_cursor_tail", True):
+    def _draw_cursor_tail(
+        self,
+        painter: QPainter,
+        samples: List[tuple[float, float, float]],
+        now: float,
+        draw_progress: float,
+    ):
+        if not self._cursor_tail_enabled:
             return
 
-        base_width = self.config["cursor_tail_width"]
+        base_width = self._cursor_tail_width
         if base_width <= 0 or len(samples) < 2:
             return
 
-        base_color = QColor(self.config["cursor_tail_color"])
+        base_color = QColor(self._cursor_tail_color)
         if base_color.alpha() <= 0:
             return
 
-        draw_progress = self._draw_mode_progress(now)
         width = max(2, int(base_width * (0.9 - 0.3 * draw_progress)) + 2)
 
-        pen = QPen(base_color)
-        pen.setWidth(width)
-        pen.setCapStyle(Qt.RoundCap)
         painter.setBrush(Qt.NoBrush)
 
-        max_age = max(1e-6, self.config["cursor_tail_max_age"])
+        max_age = self._cursor_tail_max_age_clamped
+        max_age_inv = self._cursor_tail_max_age_inv
         alpha_modifier = 0.6 + 0.4 * (1.0 - draw_progress)
 
+        # Segments are grouped into a few alpha levels so each level is stroked
+        # with a single pen change and drawPath call.
+        buckets: List[Optional[QPainterPath]] = [None] * TAIL_ALPHA_BUCKETS
+        last_bucket = -1
         for idx in range(1, len(samples)):
-            t0, p0 = samples[idx - 1]
-            t1, p1 = samples[idx]
+            t0, x0, y0 = samples[idx - 1]
+            t1, x1, y1 = samples[idx]
             age = min(now - t0, now - t1)
             if age >= max_age:
+                last_bucket = -1
                 continue
-            alpha_scale = max(0.0, 1.0 - (age / max_age))
-            segment_color = QColor(base_color)
-            segment_color.setAlpha(int(base_color.alpha() * alpha_scale * alpha_modifier))
-            pen.setColor(segment_color)
-            painter.setPen(pen)
-            painter.drawLine(p0, p1)
+            alpha_scale = max(0.0, 1.0 - age * max_age_inv)
+            bucket = min(TAIL_ALPHA_BUCKETS - 1, int(alpha_scale * TAIL_ALPHA_BUCKETS))
+            path = buckets[bucket]
+            if path is None:
+                path = buckets[bucket] = QPainterPath()
+            if bucket != last_bucket:
+                path.moveTo(x0, y0)
+            path.lineTo(x1, y1)
+            last_bucket = bucket
+
+        # base_color is already a private copy, and the pen cache copies the
+        # color it is given, so one QColor is re-tinted for every bucket.
+        base_alpha = base_color.alpha() * alpha_modifier
+        for bucket, path in enumerate(buckets):
+            if path is None:
+                continue
+            base_color.setAlpha(int(base_alpha * (bucket + 1) / TAIL_ALPHA_BUCKETS))
+            painter.setPen(self._get_pen(base_color, width, Qt.RoundCap))
+            painter.drawPath(path)
 
     def _draw_focus_overlay(self, painter: QPainter, position: QPointF):
-        if not (self.focus_overlay_active and self.effect_flags.get("enable_focus_overlay", True)):
+        if not (self.focus_overlay_active and self._focus_overlay_enabled):
             return
-        radius = float(self.config.get("focus_overlay_radius", 0.0))
-        opacity = float(self.config.get("focus_overlay_opacity", 0.0))
+        radius = self._focus_overlay_radius
+        opacity = self._focus_overlay_opacity
         if radius <= 0.0 or opacity <= 0.0:
             return
         overlay_color = QColor(0, 0, 0)
@@ -899,29 +1239,70 @@ class OverlayWindow(QWidget):
             return
         overlay_color.setAlpha(alpha)
 
-        painter.save()
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(overlay_color)
-        painter.drawRect(self.rect())
-        painter.setCompositionMode(QPainter.CompositionMode_Clear)
-        painter.drawEllipse(position, radius, radius)
-        painter.restore()
-
-    def _draw_click_effects(self, painter: QPainter, markers: List[ClickMarker], now: float):
-        if not markers:
+        # The spotlight square comes from a cached pixmap with the hole already
+        # cut out; the rest of the window is four plain fills around it, so no
+        # frame repaints the full window with a composition mode switch.
+        side = 2 * math.ceil(radius) + 2
+        hole = self._focus_hole_pixmap(radius, side, overlay_color)
+        # The bands are placed from the pixmap's own logical size, which is a
+        # whole number of device pixels and can be slightly larger than side at
+        # fractional scale factors. Snapping to device pixels keeps every band
+        # edge and the pixmap edge on the same pixel boundary, without seams.
+        ratio = hole.devicePixelRatio()
+        extent = hole.width() / ratio
+        left = round((position.x() - extent / 2.0) * ratio) / ratio
+        top = round((position.y() - extent / 2.0) * ratio) / ratio
+        width = float(self.width())
+        height = float(self.height())
+        bands = (
+            QRectF(0.0, 0.0, width, top),
+            QRectF(0.0, top + extent, width, height - top - extent),
+            QRectF(0.0, top, left, extent),
+            QRectF(left + extent, top, width - left - extent, extent),
+        )
+        # Without antialiasing a band edge that lands a rounding error off a
+        # device pixel is snapped to it instead of being filled at ~99% coverage.
+        antialiased = painter.testRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        for band in bands:
+            if band.width() > 0.0 and band.height() > 0.0:
+                painter.fillRect(band, overlay_color)
+        painter.setRenderHint(QPainter.Antialiasing, antialiased)
+        painter.drawPixmap(QPointF(left, top), hole)
+
+    def _focus_hole_pixmap(self, radius: float, side: int, color: QColor) -> QPixmap:
+        ratio = self.devicePixelRatioF()
+        key = (radius, color.rgba(), ratio)
+        cached = self._focus_hole_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        device_side = math.ceil(side * ratio)
+        extent = device_side / ratio
+        pixmap = QPixmap(device_side, device_side)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(color)
+        hole_painter = QPainter(pixmap)
+        hole_painter.setRenderHint(QPainter.Antialiasing, True)
+        hole_painter.setPen(Qt.NoPen)
+        hole_painter.setBrush(Qt.black)
+        hole_painter.setCompositionMode(QPainter.CompositionMode_Clear)
+        hole_painter.drawEllipse(QPointF(extent / 2.0, extent / 2.0), radius, radius)
+        hole_painter.end()
+
+        self._focus_hole_cache = (key, pixmap)
+        return pixmap
+
+    def _draw_click_effects(self, painter: QPainter, phases: List[Tuple[ClickMarker, float, float, bool]]):
+        if not phases:
             return
-        for marker in markers:
-            progress, strength, completed = self._click_effect_phase(marker, now)
+        dispatch = self._click_draw_dispatch
+        generic = self._draw_generic_click_indicator
+        for marker, progress, strength, completed in phases:
             if completed:
                 continue
-            if marker.button == "left":
-                self._draw_left_click_ripple(painter, marker.position, marker.color, progress, strength)
-            elif marker.button == "right":
-                self._draw_right_click_corners(painter, marker.position, marker.color, progress, strength)
-            elif marker.button == "middle":
-                self._draw_middle_click_cross(painter, marker.position, marker.color, progress, strength)
-            else:
-                self._draw_generic_click_indicator(painter, marker.position, marker.color, progress, strength)
+            draw = dispatch.get(marker.button, generic)
+            draw(painter, marker.position, marker.color, progress, strength)
 
     def _draw_left_click_ripple(
         self,
@@ -931,11 +1312,16 @@ class OverlayWindow(QWidget):
         progress: float,
         strength: float,
     ):
+        base_alpha = base_color.alpha() * strength
+        if base_alpha < 1.0:
+            return
         painter.setBrush(Qt.NoBrush)
-        base_radius = self.config["click_radius"]
-        outline = max(1, self.config["click_outline_thickness"])
+        base_radius = self._click_radius
+        outline = self._click_outline_width
         ripple_count = 3
         step = 0.18
+        ring_color = self._click_scratch_color
+        ring_color.setRgba(base_color.rgba())
         for idx in range(ripple_count):
             start = idx * step
             if progress < start:
@@ -943,12 +1329,12 @@ class OverlayWindow(QWidget):
             local = (progress - start) / max(1e-6, 1.0 - start)
             if local > 1.0:
                 continue
-            ring_color = QColor(base_color)
-            ring_color.setAlpha(int(base_color.alpha() * max(0.0, (1.0 - local)) * strength))
+            ring_alpha = int(base_alpha * max(0.0, (1.0 - local)))
+            if ring_alpha <= 0:
+                continue
+            ring_color.setAlpha(ring_alpha)
             radius = base_radius * (0.15 + 1.8 * local + 0.28 * idx)
-            pen = QPen(ring_color)
-            pen.setWidth(max(1, int(outline * (1.0 - 0.5 * local))))
-            painter.setPen(pen)
+            painter.setPen(self._get_pen(ring_color, max(1, int(outline * (1.0 - 0.5 * local)))))
             painter.drawEllipse(position, radius, radius)
 
     def _draw_right_click_corners(
@@ -959,25 +1345,28 @@ class OverlayWindow(QWidget):
         progress: float,
         strength: float,
     ):
-        pulse = 1.0 + 0.2 * math.sin(math.pi * progress)
-        alpha = max(0.0, 1.0 - progress)
-        color = QColor(base_color)
-        color.setAlpha(int(base_color.alpha() * alpha * strength))
-
-        base_length = self.config["click_radius"] * 1.15 * pulse
-        tick_length = base_length * 0.55
-        pen = QPen(color)
-        pen.setWidth(max(1, self.config["click_outline_thickness"]))
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
+        opacity = max(0.0, 1.0 - progress) * strength
+        if int(base_color.alpha() * opacity) <= 0:
+            return
+        pulse = _PULSE_LUT[int(progress * PULSE_LUT_SIZE) % PULSE_LUT_SIZE]
+        base_length = self._quantize_glyph_size(self._click_radius * 1.15 * pulse)
 
-        for dx in (-1, 1):
-            for dy in (-1, 1):
-                corner = QPointF(position.x() + dx * base_length, position.y() + dy * base_length)
-                horiz_end = QPointF(corner.x() - dx * tick_length, corner.y())
-                vert_end = QPointF(corner.x(), corner.y() - dy * tick_length)
-                painter.drawLine(corner, horiz_end)
-                painter.drawLine(corner, vert_end)
+        def render(glyph_painter: QPainter, center: float):
+            tick_length = base_length * 0.55
+            # All eight ticks go into one path as separate subpaths, so cap styles
+            # match individual drawLine calls without a QPointF per endpoint.
+            path = QPainterPath()
+            for dx in (-1, 1):
+                for dy in (-1, 1):
+                    corner_x = center + dx * base_length
+                    corner_y = center + dy * base_length
+                    path.moveTo(corner_x, corner_y)
+                    path.lineTo(corner_x - dx * tick_length, corner_y)
+                    path.moveTo(corner_x, corner_y)
+                    path.lineTo(corner_x, corner_y - dy * tick_length)
+            glyph_painter.drawPath(path)
+
+        self._draw_click_glyph(painter, ("right", base_length), position, base_length, base_color, opacity, render)
 
     def _draw_middle_click_cross(
         self,
@@ -987,25 +1376,21 @@ class OverlayWindow(QWidget):
         progress: float,
         strength: float,
     ):
-        pulse = 1.0 + 0.2 * math.sin(math.pi * progress)
-        alpha = max(0.0, 1.0 - progress)
-        color = QColor(base_color)
-        color.setAlpha(int(base_color.alpha() * alpha * strength))
-
-        half = self.config["click_radius"] * 0.85 * pulse
-        pen = QPen(color)
-        pen.setWidth(max(1, self.config["click_outline_thickness"]))
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
+        opacity = max(0.0, 1.0 - progress) * strength
+        if int(base_color.alpha() * opacity) <= 0:
+            return
+        pulse = _PULSE_LUT[int(progress * PULSE_LUT_SIZE) % PULSE_LUT_SIZE]
+        half = self._quantize_glyph_size(self._click_radius * 0.85 * pulse)
 
-        painter.drawLine(
-            QPointF(position.x() - half, position.y() - half),
-            QPointF(position.x() + half, position.y() + half),
-        )
-        painter.drawLine(
-            QPointF(position.x() - half, position.y() + half),
-            QPointF(position.x() + half, position.y() - half),
-        )
+        def render(glyph_painter: QPainter, center: float):
+            path = QPainterPath()
+            path.moveTo(center - half, center - half)
+            path.lineTo(center + half, center + half)
+            path.moveTo(center - half, center + half)
+            path.lineTo(center + half, center - half)
+            glyph_painter.drawPath(path)
+
+        self._draw_click_glyph(painter, ("middle", half), position, half, base_color, opacity, render)
 
     def _is_button_effect_active(self, button: str) -> bool:
         if button == "left":
@@ -1022,149 +1407,214 @@ class OverlayWindow(QWidget):
         progress: float,
         strength: float,
     ):
-        color = QColor(base_color)
-        color.setAlpha(int(base_color.alpha() * max(0.0, 1.0 - progress) * strength))
-        pen = QPen(color)
-        pen.setWidth(max(1, self.config["click_outline_thickness"]))
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
-        radius = self.config["click_radius"] * (1.0 - 0.3 * progress)
-        painter.drawEllipse(position, radius, radius)
+        opacity = max(0.0, 1.0 - progress) * strength
+        if int(base_color.alpha() * opacity) <= 0:
+            return
+        radius = self._quantize_glyph_size(self._click_radius * (1.0 - 0.3 * progress))
 
-    def _click_marker_visible(self, marker: ClickMarker, now: float) -> bool:
-        _, strength, completed = self._click_effect_phase(marker, now)
-        return not completed
-
-    def _click_effect_phase(self, marker: ClickMarker, now: float) -> tuple[float, float, bool]:
-        loop_time = max(1e-6, marker.loop_time)
-        elapsed = max(0.0, now - marker.created_at)
-        progress = (elapsed / loop_time) % 1.0
-
-        duration = max(0.0, marker.duration)
-        active = self._is_button_effect_active(marker.button)
-        if active:
-            strength = 1.0
-            completed = False
+        def render(glyph_painter: QPainter, center: float):
+            glyph_painter.drawEllipse(QPointF(center, center), radius, radius)
+
+        self._draw_click_glyph(painter, ("generic", radius), position, radius, base_color, opacity, render)
+
+    @staticmethod
+    def _quantize_glyph_size(size: float) -> float:
+        return round(size * CLICK_GLYPH_SIZE_STEPS) / CLICK_GLYPH_SIZE_STEPS
+
+    def _draw_click_glyph(
+        self,
+        painter: QPainter,
+        shape: Tuple[str, float],
+        position: QPointF,
+        extent: float,
+        color: QColor,
+        opacity: float,
+        render: Callable[[QPainter, float], None],
+    ):
+        # Click glyphs only differ by a quantized size while a marker fades, so
+        # each shape is rendered once at full strength and blitted with opacity.
+        width = self._click_outline_width
+        ratio = self.devicePixelRatioF()
+        key = (*shape, color.rgba(), width, ratio)
+        center = math.ceil(extent + width)
+        cache = self._click_glyph_cache
+        pixmap = cache.get(key)
+        if pixmap is not None:
+            cache.move_to_end(key)
         else:
-            fade = max(0.0, self.config["click_effect_fade_duration"])
-            release_time = marker.release_at
-            if release_time is None:
-                release_time = marker.created_at
-            release_elapsed = max(0.0, now - release_time)
-
-            if release_elapsed <= duration:
-                strength = 1.0
-                completed = False
-            elif fade > 0.0 and release_elapsed <= (duration + fade):
-                fade_elapsed = release_elapsed - duration
-                strength = max(0.0, 1.0 - (fade_elapsed / fade))
-                completed = False
-            else:
-                strength = 0.0
-                completed = True
-        return progress, strength, completed
+            side = 2 * center
+            pixmap = QPixmap(max(1, math.ceil(side * ratio)), max(1, math.ceil(side * ratio)))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            glyph_painter = QPainter(pixmap)
+            glyph_painter.setRenderHint(QPainter.Antialiasing, True)
+            glyph_painter.setPen(self._get_pen(color, width))
+            glyph_painter.setBrush(Qt.NoBrush)
+            render(glyph_painter, float(center))
+            glyph_painter.end()
+            cache[key] = pixmap
+            if len(cache) > CLICK_GLYPH_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        painter.setOpacity(opacity)
+        painter.drawPixmap(QPointF(position.x() - center, position.y() - center), pixmap)
+        painter.setOpacity(1.0)
+
+    def _click_marker_visible(self, marker: ClickMarker, now: float) -> bool:
+        return not _click_phase_completed(
+            now,
+            marker.created_at,
+            marker.duration,
+            marker.release_at,
+            self._click_fade_duration,
+            self._is_button_effect_active(marker.button),
+        )
+
+    def _click_effect_phases(
+        self, markers: List[ClickMarker], now: float
+    ) -> List[Tuple[ClickMarker, float, float, bool]]:
+        """Compute every marker's phase once per frame for all the draw helpers."""
+        if not markers:
+            return []
+        fade = self._click_fade_duration
+        active_by_button: Dict[str, bool] = {}
+        phases = []
+        for marker in markers:
+            button = marker.button
+            active = active_by_button.get(button)
+            if active is None:
+                active = active_by_button[button] = self._is_button_effect_active(button)
+            progress, strength, completed = _click_phase(
+                now, marker.created_at, marker.loop_time, marker.duration, marker.release_at, fade, active
+            )
+            phases.append((marker, progress, strength, completed))
+        return phases
+
+    def _ring_effect_fade(self, phases: List[Tuple[ClickMarker, float, float, bool]]) -> float:
+        # One pass picks the oldest right and middle phase, as the ring only
+        # reacts to the first marker of each button.
+        first_phase: Dict[str, Tuple[ClickMarker, float, float, bool]] = {}
+        for phase in phases:
+            first_phase.setdefault(phase[0].button, phase)
 
-    def _ring_effect_fade(self, markers: List[ClickMarker], now: float) -> float:
         fade = 1.0
         for button in ("right", "middle"):
-            marker = self._find_marker(markers, button)
-            if not marker:
+            phase = first_phase.get(button)
+            if phase is None:
                 continue
-            progress, strength, completed = self._click_effect_phase(marker, now)
+            _, progress, strength, completed = phase
             if completed and strength <= 0.0:
                 continue
             effect_strength = max(strength, progress)
             fade *= max(0.3, 1.0 - 0.6 * effect_strength)
         return fade
 
-    @staticmethod
-    def _find_marker(markers: List[ClickMarker], button: str) -> Optional[ClickMarker]:
-        for marker in markers:
-            if marker.button == button:
-                return marker
-        return None
-
     def _draw_strokes(self, painter: QPainter, strokes, now: float, persist: float, fade: float):
-        if not self.effect_flags.get("enable_painting", True):
+        if not self._painting_enabled:
             return
         if not strokes:
             return
 
-        pen = QPen()
-        pen.setWidth(self.config["drag_line_width"])
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
+        width = self._drag_line_width
+        full_strength_age = persist - fade
 
         for stroke in strokes:
             age = now - stroke.created_at
-            if age > persist or len(stroke.points) < 2:
+            if age > persist or stroke.points.size() < 2:
                 continue
 
-            alpha_scale = self._alpha_scale(age, persist, fade)
-            color = QColor(stroke.color)
-            color.setAlpha(int(color.alpha() * alpha_scale))
-            pen.setColor(color)
-            painter.setPen(pen)
-
-            path = QPainterPath()
-            path.moveTo(stroke.points[0])
-            for point in stroke.points[1:]:
-                path.lineTo(point)
-            painter.drawPath(path)
+            # Completed strokes are rasterized once; fading only changes the
+            # opacity the cached pixmap is blitted with.
+            opacity = 1.0
+            if age > full_strength_age:
+                opacity = _alpha_scale(age, persist, fade)
+                if opacity * stroke.color.alpha() < 1.0:
+                    continue
+            pixmap = self._stroke_pixmap(stroke, width)
+            painter.setOpacity(opacity)
+            painter.drawPixmap(stroke.pixmap_origin, pixmap)
+        painter.setOpacity(1.0)
+
+    def _stroke_pixmap(self, stroke: Stroke, width: int) -> QPixmap:
+        ratio = self.devicePixelRatioF()
+        key = (ratio, width)
+        if stroke.pixmap is not None and stroke.pixmap_key == key:
+            return stroke.pixmap
+
+        # Sized to the stroke's bounding box plus the pen, not to the window.
+        margin = width / 2.0 + 2.0
+        left = math.floor(stroke.min_x - margin)
+        top = math.floor(stroke.min_y - margin)
+        box_width = math.ceil(stroke.max_x + margin) - left
+        box_height = math.ceil(stroke.max_y + margin) - top
+        pixmap = QPixmap(max(1, math.ceil(box_width * ratio)), max(1, math.ceil(box_height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
 
-    def _draw_active_stroke(self, painter: QPainter, points: List[QPointF], color: QColor):
-        if not self.effect_flags.get("enable_painting", True):
+        stroke_painter = QPainter(pixmap)
+        stroke_painter.setRenderHint(QPainter.Antialiasing, True)
+        stroke_painter.translate(-left, -top)
+        stroke_painter.setPen(self._get_pen(stroke.color, width))
+        stroke_painter.setBrush(Qt.NoBrush)
+        stroke_painter.drawPolyline(stroke.points)
+        stroke_painter.end()
+
+        stroke.pixmap = pixmap
+        stroke.pixmap_origin = QPointF(left, top)
+        stroke.pixmap_key = key
+        return pixmap
+
+    def _draw_active_stroke(self, painter: QPainter, points: QPolygonF, color: QColor):
+        if not self._painting_enabled:
             return
-        if len(points) < 2:
+        if points.size() < 2:
             return
-        pen = QPen(color)
-        pen.setWidth(self.config["drag_line_width"])
-        painter.setPen(pen)
+        painter.setPen(self._get_pen(color, self._drag_line_width))
         painter.setBrush(Qt.NoBrush)
+        painter.drawPolyline(points)
 
-        path = QPainterPath()
-        path.moveTo(points[0])
-        for point in points[1:]:
-            path.lineTo(point)
-        painter.drawPath(path)
-
-    def _draw_key_indicators(self, painter: QPainter, indicators: List[KeyIndicator], now: float):
+    def _draw_key_indicators(
+        self,
+        painter: QPainter,
+        indicators: List[Tuple[str, float, Optional[float]]],
+        now: float,
+    ):
         if not self._key_display_enabled or not indicators:
             return
 
-        drawables: List[Tuple[KeyIndicator, float]] = []
-        for indicator in indicators:
-            visibility = self._key_visibility(indicator, now)
+        drawables: List[Tuple[str, float]] = []
+        for label, pressed_at, released_at in indicators:
+            visibility = self._key_visibility(pressed_at, released_at, now)
             if visibility <= 0.0:
                 continue
-            drawables.append((indicator, visibility))
+            drawables.append((label, visibility))
 
         if not drawables:
             return
 
         painter.save()
-        font_size = self.config["key_display_font_size"]
+        font_size = self._key_font_size
         if font_size > 0.0:
             font = painter.font()
             font.setPointSizeF(font_size)
             painter.setFont(font)
         metrics = painter.fontMetrics()
 
-        padding = max(0.0, self.config["key_display_padding"])
-        spacing = max(0.0, self.config["key_display_spacing"])
-        margin = max(0.0, self.config["key_display_margin"])
-        requested_height = self.config["key_display_height"]
+        padding = self._key_padding
+        spacing = self._key_spacing
+        margin = self._key_margin
+        requested_height = self._key_height
         base_height = requested_height if requested_height > 0.0 else metrics.height() + 2.0 * padding
-        rise = max(0.0, self.config["key_display_rise_distance"])
-        corner_radius = max(0.0, self.config["key_display_corner_radius"])
-        base_bg: QColor = self.config["key_display_background"]
-        base_text: QColor = self.config["key_display_text_color"]
-
-        measured: List[Tuple[KeyIndicator, float, float]] = []
-        for indicator, visibility in drawables:
-            text_width = metrics.horizontalAdvance(indicator.label)
+        rise = self._key_rise_distance
+
+        measured: List[Tuple[str, float, float]] = []
+        label_widths = self._key_label_widths
+        for label, visibility in drawables:
+            text_width = label_widths.get(label)
+            if text_width is None:
+                text_width = label_widths[label] = metrics.horizontalAdvance(label)
             box_width = text_width + 2.0 * padding
-            measured.append((indicator, visibility, box_width))
+            measured.append((label, visibility, box_width))
 
         total_width = sum(item[2] for item in measured)
         if len(measured) > 1:
@@ -1172,55 +1622,78 @@ class OverlayWindow(QWidget):
 
         x = margin
         base_y = self.height() - margin - base_height
+        self._key_strip_top = base_y - 1.0
 
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        for indicator, visibility, box_width in measured:
+        # Each label is composed once (background and text) into a pixmap; the
+        # rise and fade only move it and change the opacity it is drawn with.
+        font = painter.font()
+        ratio = self.devicePixelRatioF()
+        for label, visibility, box_width in measured:
             top_offset = (1.0 - visibility) * rise
-            rect = QRectF(x, base_y + top_offset, box_width, base_height)
+            pixmap = self._key_pixmap(label, box_width, base_height, font, ratio)
+            painter.setOpacity(visibility)
+            painter.drawPixmap(QPointF(x, base_y + top_offset), pixmap)
+            x += box_width + spacing
 
-            background = QColor(base_bg)
-            background.setAlphaF(background.alphaF() * visibility)
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(background)
-            painter.drawRoundedRect(rect, corner_radius, corner_radius)
+        painter.restore()
 
-            text_color = QColor(base_text)
-            text_color.setAlphaF(text_color.alphaF() * visibility)
-            painter.setPen(text_color)
-            painter.drawText(rect, Qt.AlignCenter, indicator.label)
+    def _key_pixmap(self, label: str, width: float, height: float, font: QFont, ratio: float) -> QPixmap:
+        key = (label, width, height, ratio)
+        pixmap = self._key_pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap
 
-            x += box_width + spacing
+        pixmap = QPixmap(max(1, math.ceil(width * ratio)), max(1, math.ceil(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        rect = QRectF(0.0, 0.0, width, height)
+        corner_radius = self._key_corner_radius
+
+        key_painter = QPainter(pixmap)
+        key_painter.setRenderHint(QPainter.Antialiasing, True)
+        key_painter.setFont(font)
+        key_painter.setPen(Qt.NoPen)
+        key_painter.setBrush(self._key_background)
+        if corner_radius > 0.0:
+            key_painter.drawRoundedRect(rect, corner_radius, corner_radius)
+        else:
+            key_painter.drawRect(rect)
+        key_painter.setPen(self._key_text_color)
+        key_painter.drawText(rect, Qt.AlignCenter, label)
+        key_painter.end()
 
-        painter.restore()
+        self._key_pixmaps[key] = pixmap
+        return pixmap
 
-    def _key_visibility(self, indicator: KeyIndicator, now: float) -> float:
-        if indicator.released_at is None:
+    def _key_visibility(self, pressed_at: float, released_at: Optional[float], now: float) -> float:
+        if released_at is None:
             if self._key_press_duration <= 0.0:
                 return 1.0
-            elapsed = max(0.0, now - indicator.pressed_at)
+            elapsed = max(0.0, now - pressed_at)
             progress = elapsed / max(self._key_press_duration, 1e-6)
             return self._ease_out_cubic(min(1.0, max(0.0, progress)))
 
         if self._key_release_duration <= 0.0:
             return 0.0
 
-        elapsed = max(0.0, now - indicator.released_at)
+        elapsed = max(0.0, now - released_at)
         progress = elapsed / max(self._key_release_duration, 1e-6)
         return max(0.0, 1.0 - self._ease_in_cubic(min(1.0, max(0.0, progress))))
 
     @staticmethod
     def _ease_out_cubic(value: float) -> float:
         value = max(0.0, min(1.0, value))
-        return 1.0 - pow(1.0 - value, 3)
+        inverse = 1.0 - value
+        return 1.0 - inverse * inverse * inverse
 
     @staticmethod
     def _ease_in_cubic(value: float) -> float:
         value = max(0.0, min(1.0, value))
-        return pow(value, 3)
+        return value * value * value
 
     def _cursor_idle_alpha(self, now: float) -> float:
-        timeout = max(0.0, self.config["cursor_idle_timeout"])
-        fade = max(0.0, self.config["cursor_idle_fade_duration"])
+        timeout = self._cursor_idle_timeout
+        fade = self._cursor_idle_fade_duration
         idle_time = max(0.0, now - self._cursor_last_moved)
 
         if idle_time <= timeout:
@@ -1237,27 +1710,14 @@ class OverlayWindow(QWidget):
     def _draw_mode_progress(self, now: float) -> float:
         if not self.left_button_down or self._left_press_time is None or self.active_stroke is None:
             return 0.0
-        shrink_time = max(1e-6, self.config["cursor_draw_shrink_time"])
+        shrink_time = self._cursor_draw_shrink_time
         return max(0.0, min(1.0, (now - self._left_press_time) / shrink_time))
 
     def _click_effect_loop_time(self, button: str) -> float:
-        loop_time = max(1e-6, self.config["click_effect_loop_time"])
-        return loop_time
+        return self._click_loop_time
 
     def _click_effect_duration(self, button: str) -> float:
-        duration = max(0.0, self.config["click_effect_duration"])
-        return duration
-
-    @staticmethod
-    def _alpha_scale(age: float, persist: float, fade: float) -> float:
-        if age <= (persist - fade):
-            return 1.0
-        if fade <= 0.0:
-            return 0.0 if age > persist else 1.0
-        remaining = persist - age
-        if remaining <= 0.0:
-            return 0.0
-        return max(0.0, min(1.0, remaining / fade))
+        return self._click_duration
 
     def closeEvent(self, event):
         self._listener.stop()
@@ -1282,36 +1742,51 @@ class OverlayWindow(QWidget):
             tracked.release_at = release_time
         self._press_markers[button] = None
 
-    def _enforce_click_marker_limit(self):
-        limit = self.config.get("max_click_markers", 0)
-        if limit and limit > 0:
-            excess = len(self.click_markers) - limit
-            if excess > 0:
-                removed = self.click_markers[:excess]
-                del self.click_markers[:excess]
-                for button, marker in self._press_markers.items():
-                    if marker in removed:
-                        self._press_markers[button] = None
-
-    def _append_point_to_active_stroke(self, point: QPointF):
+    def _append_click_marker_locked(self, marker: ClickMarker):
+        markers = self.click_markers
+        if markers.maxlen is not None and len(markers) == markers.maxlen:
+            evicted = markers[0]  # the deque drops this one on append
+            if self._press_markers.get(evicted.button) is evicted:
+                self._press_markers[evicted.button] = None
+        markers.append(marker)
+
+    def _filter_click_markers(self, keep: Callable[[ClickMarker], bool]):
+        # Filters in place by rotating through the deque once, so the marker
+        # limit (the deque's maxlen) is preserved without rebuilding it.
+        markers = self.click_markers
+        for _ in range(len(markers)):
+            marker = markers.popleft()
+            if keep(marker):
+                markers.append(marker)
+
+    def _resize_click_markers(self):
+        limit = self._max_click_markers
+        maxlen = limit if limit and limit > 0 else None
+        if self.click_markers.maxlen == maxlen:
+            return
+        with self._lock:
+            self.click_markers = deque(self.click_markers, maxlen=maxlen)
+            for button, marker in self._press_markers.items():
+                if marker is not None and marker not in self.click_markers:
+                    self._press_markers[button] = None
+
+    def _append_point_to_active_stroke(self, x: float, y: float):
         if not self.active_stroke:
             return
-        points = self.active_stroke.points
-        if not points:
-            points.append(point)
+        stroke = self.active_stroke
+        if stroke.points.isEmpty():
+            stroke.add_point(x, y)
             return
-        last_point = points[-1]
-        dx = point.x() - last_point.x()
-        dy = point.y() - last_point.y()
+        dx = x - stroke.last_x
+        dy = y - stroke.last_y
         if (dx * dx + dy * dy) < self._min_point_distance_sq:
             return
-        points.append(point)
+        stroke.add_point(x, y)
 
     def _apply_config(self, normalized: Dict[str, object], raw_config: Dict[str, object], reset_runtime: bool = False):
         self.config = dict(normalized)
         self.raw_config = dict(raw_config)
-        self._min_point_distance_sq = float(self.config["min_point_distance"]) ** 2
-        self._cursor_tail_min_distance_sq = float(self.config["cursor_tail_min_distance"]) ** 2
+        self._raw_config_text = None
 
         updated_flags = {
             "enable_click_left": self.config.get("enable_click_left", True),
@@ -1332,17 +1807,76 @@ class OverlayWindow(QWidget):
 
         self._apply_flag_dependencies()
 
-        self._focus_hotkey_set = self._parse_hotkey_spec(self.config.get("focus_overlay_hotkey", ""))
+        self._focus_hotkey_set = frozenset(self._parse_hotkey_spec(self.config.get("focus_overlay_hotkey", "")))
+        # Parsed once per config load; listener (re)starts only bind these.
+        self._hotkey_combos: Dict[str, frozenset] = {}
+        for spec_key in HOTKEY_CONFIG_KEYS:
+            combo = self._parse_hotkey_spec(self.config.get(spec_key))
+            if combo:
+                self._hotkey_combos[spec_key] = frozenset(combo)
         opacity = float(self.config.get("focus_overlay_opacity", 0.0))
         self.config["focus_overlay_opacity"] = max(0.0, min(1.0, opacity))
+        self._cache_config_values()
+        self._resize_click_markers()
         if not self._focus_hotkey_set:
             self._set_focus_overlay(False)
             self._pressed_keys.clear()
 
         if hasattr(self, "_timer") and self._timer is not None:
+            self._timer_throttled = False
             self._timer.setInterval(int(self.config["update_interval_ms"]))
         self._restart_hotkey_listener()
 
+    def _cache_config_values(self):
+        """Bind the normalized values read while painting or handling input to plain attributes."""
+        config = self.config
+        self._min_point_distance_sq = float(config["min_point_distance"]) ** 2
+        self._cursor_tail_min_distance_sq = float(config["cursor_tail_min_distance"]) ** 2
+        self._persist_duration = config["persist_duration"]
+        self._fade_window = max(0.0, min(config["fade_duration"], self._persist_duration))
+        self._cursor_ring_color = config["cursor_ring_color"]
+        self._cursor_ring_radius = config["cursor_ring_radius"]
+        self._cursor_ring_thickness = config["cursor_ring_thickness"]
+        self._cursor_tail_color = config["cursor_tail_color"]
+        self._cursor_tail_width = config["cursor_tail_width"]
+        self._cursor_tail_max_age = config["cursor_tail_max_age"]
+        self._cursor_tail_max_age_clamped = max(1e-6, self._cursor_tail_max_age)
+        self._cursor_tail_max_age_inv = 1.0 / self._cursor_tail_max_age_clamped
+        self._cursor_tail_max_length = config["cursor_tail_max_length"]
+        self._cursor_idle_timeout = max(0.0, config["cursor_idle_timeout"])
+        self._cursor_idle_fade_duration = max(0.0, config["cursor_idle_fade_duration"])
+        self._cursor_draw_shrink_time = max(1e-6, config["cursor_draw_shrink_time"])
+        self._click_colors = config["click_colors"]
+        self._click_radius = config["click_radius"]
+        self._click_outline_width = max(1, config["click_outline_thickness"])
+        self._click_loop_time = max(1e-6, config["click_effect_loop_time"])
+        self._click_duration = max(0.0, config["click_effect_duration"])
+        self._click_fade_duration = max(0.0, config["click_effect_fade_duration"])
+        self._max_click_markers = config.get("max_click_markers", 0)
+        self._drag_color = config["drag_color"]
+        self._drag_line_width = config["drag_line_width"]
+        self._focus_overlay_radius = float(config.get("focus_overlay_radius", 0.0))
+        self._focus_overlay_opacity = float(config.get("focus_overlay_opacity", 0.0))
+        self._key_font_size = config["key_display_font_size"]
+        # Label widths and the strip height depend on the font size, so both are
+        # re-measured after a reload, and the composed labels are redrawn in the
+        # new colors. The repaint region covers the whole window until keys have
+        # been drawn once.
+        self._key_label_widths: Dict[str, float] = {}
+        self._key_pixmaps: Dict[Tuple[str, float, float, float], QPixmap] = {}
+        self._key_strip_top: Optional[float] = None
+        self._key_padding = max(0.0, config["key_display_padding"])
+        self._key_spacing = max(0.0, config["key_display_spacing"])
+        self._key_margin = max(0.0, config["key_display_margin"])
+        self._key_height = config["key_display_height"]
+        self._key_rise_distance = max(0.0, config["key_display_rise_distance"])
+        self._key_corner_radius = max(0.0, config["key_display_corner_radius"])
+        self._key_background = config["key_display_background"]
+        self._key_text_color = config["key_display_text_color"]
+        self._key_press_duration = float(config.get("key_display_press_duration", 0.0))
+        self._key_release_duration = float(config.get("key_display_release_duration", 0.0))
+        self._key_max_visible = int(config.get("key_display_max_visible", 0))
+
     def set_effect_enabled(self, key: str, enabled: bool):
         enabled = bool(enabled)
         with self._lock:
@@ -1360,16 +1894,27 @@ class OverlayWindow(QWidget):
 
     def apply_config_from_raw(self, raw_dict: Dict[str, object]):
         normalized, merged = _prepare_config(raw_dict)
-        with self._lock:
-            self._apply_config(normalized, merged, reset_runtime=True)
+        # Not under self._lock: the callees lock the shared state they touch,
+        # and the lock is not reentrant.
+        self._apply_config(normalized, merged, reset_runtime=True)
         self.save_config()
         self._notify_control_panel("Configuration applied")
 
+    def raw_config_text(self) -> str:
+        # Serialized lazily and reused until the next config is applied.
+        if self._raw_config_text is None:
+            self._raw_config_text = json.dumps(self.raw_config, indent=2)
+        return self._raw_config_text
+
     def save_config(self):
         if not self.config_path or self.raw_config is None:
             return
+        # Written next to the target and swapped in, so a failed or interrupted
+        # save never leaves a truncated config.json behind.
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
         try:
-            self.config_path.write_text(json.dumps(self.raw_config, indent=2))
+            tmp_path.write_text(self.raw_config_text(), encoding="utf-8")
+            os.replace(tmp_path, self.config_path)
         except OSError as exc:
             print(f"Warning: unable to save config: {exc}", file=sys.stderr)
 
@@ -1377,80 +1922,92 @@ class OverlayWindow(QWidget):
         self.left_button_down = False
         self._left_press_time = None
         self.active_stroke = None
-        self.click_initial_position = QPointF(0, 0)
+        self.click_initial_position = (0.0, 0.0)
 
     def _is_click_enabled(self, button: str) -> bool:
-        return self.effect_flags.get(f"enable_click_{button}", True)
+        return button not in self._disabled_click_buttons
+
+    def _clear_cursor_tail(self):
+        self.cursor_tail.clear()
+        self._cursor_tail_length = 0.0
+
+    def _pop_cursor_tail_sample(self):
+        tail = self.cursor_tail
+        _, x0, y0 = tail.popleft()
+        if tail:
+            _, x1, y1 = tail[0]
+            dx = x1 - x0
+            dy = y1 - y0
+            self._cursor_tail_length -= math.sqrt(dx * dx + dy * dy)
+        if len(tail) < 2:
+            self._cursor_tail_length = 0.0  # drop accumulated rounding error
 
     def _update_cursor_tail(self, now: float):
-        if not self.effect_flags.get("enable_cursor_tail", True):
-            self.cursor_tail.clear()
+        if not self._cursor_tail_enabled:
+            self._clear_cursor_tail()
             return
 
-        max_age = self.config["cursor_tail_max_age"]
-        width = self.config["cursor_tail_width"]
+        max_age = self._cursor_tail_max_age
+        width = self._cursor_tail_width
         if max_age <= 0.0 or width <= 0:
             if self.cursor_tail:
-                self.cursor_tail.clear()
+                self._clear_cursor_tail()
             return
 
-        position = QPointF(self.cursor_pos)
+        x, y = self.cursor_pos
+        tail = self.cursor_tail
 
-        if not self.cursor_tail:
-            self.cursor_tail.append((now, position))
+        if not tail:
+            tail.append((now, x, y))
         else:
-            _, last_point = self.cursor_tail[-1]
-            dx = position.x() - last_point.x()
-            dy = position.y() - last_point.y()
-            if (dx * dx + dy * dy) >= self._cursor_tail_min_distance_sq:
-                self.cursor_tail.append((now, position))
+            _, last_x, last_y = tail[-1]
+            dx = x - last_x
+            dy = y - last_y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq >= self._cursor_tail_min_distance_sq:
+                tail.append((now, x, y))
+                self._cursor_tail_length += math.sqrt(distance_sq)
 
         self._trim_cursor_tail(now)
 
     def _trim_cursor_tail(self, now: float):
-        max_age = self.config["cursor_tail_max_age"]
+        max_age = self._cursor_tail_max_age
         if max_age <= 0.0:
-            self.cursor_tail.clear()
+            self._clear_cursor_tail()
             return
 
-        while self.cursor_tail and (now - self.cursor_tail[0][0]) > max_age:
-            self.cursor_tail.pop(0)
+        tail = self.cursor_tail
+        while tail and (now - tail[0][0]) > max_age:
+            self._pop_cursor_tail_sample()
 
         draw_progress = self._draw_mode_progress(now)
-        base_length = self.config["cursor_tail_max_length"]
+        base_length = self._cursor_tail_max_length
         max_length = max(0.0, base_length * (0.9 - 0.3 * draw_progress))
-        if max_length <= 0.0 or len(self.cursor_tail) < 2:
+        if max_length <= 0.0:
             return
 
-        total_length = 0.0
-        cutoff_index = 0
-        for idx in range(len(self.cursor_tail) - 1, 0, -1):
-            p_curr = self.cursor_tail[idx][1]
-            p_prev = self.cursor_tail[idx - 1][1]
-            segment = math.hypot(p_curr.x() - p_prev.x(), p_curr.y() - p_prev.y())
-            total_length += segment
-            if total_length > max_length:
-                cutoff_index = idx
-                break
-
-        if cutoff_index > 0:
-            del self.cursor_tail[:cutoff_index]
+        # The running path length is kept up to date on append and pop, so the
+        # length limit only touches the samples it actually drops.
+        while len(tail) >= 2 and self._cursor_tail_length > max_length:
+            self._pop_cursor_tail_sample()
 
     def _start_hotkey_listener(self):
         self._hotkey_bindings.clear()
+        self._hotkeys_by_key.clear()
         self._active_hotkeys.clear()
         self._pressed_keys.clear()
 
-        def register(spec_key: str, handler):
-            spec = self.config.get(spec_key)
-            combo = self._parse_hotkey_spec(spec)
-            if combo:
-                self._hotkey_bindings[frozenset(combo)] = handler
-
-        register("exit_hotkey", self._request_quit)
-        register("toggle_paint_hotkey", self._toggle_paint_hotkey)
-        register("toggle_tracking_hotkey", self._toggle_tracking_hotkey)
-        register("toggle_click_hotkey", self._toggle_click_hotkey)
+        handlers = {
+            "exit_hotkey": self._request_quit,
+            "toggle_paint_hotkey": self._toggle_paint_hotkey,
+            "toggle_tracking_hotkey": self._toggle_tracking_hotkey,
+            "toggle_click_hotkey": self._toggle_click_hotkey,
+        }
+        for spec_key, combo in self._hotkey_combos.items():
+            self._hotkey_bindings[combo] = handlers[spec_key]
+        for combo, handler in self._hotkey_bindings.items():
+            for member in combo:
+                self._hotkeys_by_key.setdefault(member, []).append((combo, handler))
 
         need_listener = bool(self._hotkey_bindings) or (
             self._focus_hotkey_set and self.effect_flags.get("enable_focus_overlay", True)
@@ -1459,16 +2016,29 @@ class OverlayWindow(QWidget):
             return
 
         try:
-            self._hotkey_listener = keyboard.Listener(
+            listener = keyboard.Listener(
                 on_press=self._on_key_press,
                 on_release=self._on_key_release,
             )
-            self._hotkey_listener.start()
-        except Exception as exc:  # noqa: BLE001
+        except Exception as exc:  # noqa: BLE001 - backend errors surface here
             print(f"Warning: unable to register hotkeys: {exc}", file=sys.stderr)
             self._hotkey_listener = None
+            return
+        self._hotkey_listener = listener
+        listener.start()
+
+    def _hotkey_signature(self) -> tuple:
+        return (
+            frozenset(self._hotkey_combos.items()),
+            self._focus_hotkey_set,
+            bool(self.effect_flags.get("enable_focus_overlay", True)),
+        )
 
     def _restart_hotkey_listener(self):
+        signature = self._hotkey_signature()
+        if self._hotkey_listener is not None and signature == self._hotkey_listener_signature:
+            return  # same bindings; keep the running OS hook
+        self._hotkey_listener_signature = signature
         if self._hotkey_listener:
             try:
                 self._hotkey_listener.stop()
@@ -1484,8 +2054,8 @@ class OverlayWindow(QWidget):
             return
         try:
             self._key_listener = keyboard.Listener(
-                on_press=self._on_key_press,
-                on_release=self._on_key_release,
+                on_press=self._on_key_display_press,
+                on_release=self._on_key_display_release,
             )
             self._key_listener.start()
         except Exception as exc:  # noqa: BLE001 - key overlay is optional
@@ -1497,15 +2067,17 @@ class OverlayWindow(QWidget):
             self._key_display_enabled = False
 
     def _request_quit(self):
-        self._quit_dispatcher.quit_requested.emit()
+        # Runs on the pynput thread; queue the shutdown onto the GUI thread.
+        QMetaObject.invokeMethod(self, "_quit_app", Qt.QueuedConnection)
 
+    @Slot()
     def _quit_app(self):
         if self._shutdown_requested:
             return
         self._shutdown_requested = True
         if self.isVisible():
             self.close()
-        app = QApplication.instance()
+        app = self.app if self.app is not None else QApplication.instance()
         if app:
             app.quit()
 
@@ -1541,140 +2113,121 @@ class OverlayWindow(QWidget):
         if not spec:
             return result
         tokens = [token.strip().lower() for token in spec.split("+")]
-        mapping = {
-            "ctrl": keyboard.Key.ctrl,
-            "control": keyboard.Key.ctrl,
-            "shift": keyboard.Key.shift,
-            "alt": keyboard.Key.alt,
-            "option": keyboard.Key.alt,
-            "cmd": getattr(keyboard.Key, "cmd", None),
-            "command": getattr(keyboard.Key, "cmd", None),
-            "win": getattr(keyboard.Key, "cmd", None),
-            "super": getattr(keyboard.Key, "cmd", None),
-            "escape": keyboard.Key.esc,
-            "esc": keyboard.Key.esc,
-            "enter": keyboard.Key.enter,
-            "return": keyboard.Key.enter,
-            "space": keyboard.Key.space,
-        }
         for token in tokens:
             if not token:
                 continue
             if token.startswith("<") and token.endswith(">"):
                 token = token[1:-1]
-            key_obj = mapping.get(token)
+            key_obj = _HOTKEY_KEY_MAP.get(token)
             if key_obj:
                 result.add(key_obj)
             elif len(token) == 1:
                 result.add(keyboard.KeyCode.from_char(token))
         return result
 
-    def _normalise_key(self, key):
-        if isinstance(key, keyboard.KeyCode):
-            char = key.char.lower() if key.char else None
-            if char and char.isprintable():
-                return keyboard.KeyCode.from_char(char)
-            vk = getattr(key, "vk", None)
-            if vk is not None:
-                try:
-                    derived = chr(vk).lower()
-                except (TypeError, ValueError):
-                    derived = None
-                if derived and derived.isprintable():
-                    return keyboard.KeyCode.from_char(derived)
-                return keyboard.KeyCode.from_vk(vk)
-        elif isinstance(key, keyboard.Key):
-            mappings = [
-                (getattr(keyboard.Key, "ctrl_l", None), keyboard.Key.ctrl),
-                (getattr(keyboard.Key, "ctrl_r", None), keyboard.Key.ctrl),
-                (getattr(keyboard.Key, "shift_l", None), keyboard.Key.shift),
-                (getattr(keyboard.Key, "shift_r", None), keyboard.Key.shift),
-                (getattr(keyboard.Key, "alt_l", None), keyboard.Key.alt),
-                (getattr(keyboard.Key, "alt_r", None), keyboard.Key.alt),
-                (getattr(keyboard.Key, "cmd_l", None), getattr(keyboard.Key, "cmd", None)),
-                (getattr(keyboard.Key, "cmd_r", None), getattr(keyboard.Key, "cmd", None)),
-            ]
-            for candidate, canonical in mappings:
-                if candidate is not None and canonical is not None and key == candidate:
-                    return canonical
-        return key
-
     def _on_key_press(self, key):
-        norm = self._normalise_key(key)
+        self._note_activity()
+        norm = _normalise_key(key)
         handlers_to_run: List[Callable] = []
         activate_focus = False
         with self._lock:
             self._pressed_keys.add(norm)
+            pressed = self._pressed_keys
             if (
-                self._focus_hotkey_set
-                and self.effect_flags.get("enable_focus_overlay", True)
-                and self._focus_hotkey_set.issubset(self._pressed_keys)
+                norm in self._focus_hotkey_set
+                and self._focus_overlay_enabled
+                and self._focus_hotkey_set <= pressed
                 and not self.focus_overlay_active
             ):
                 activate_focus = True
-            for combo, handler in self._hotkey_bindings.items():
-                if combo.issubset(self._pressed_keys) and combo not in self._active_hotkeys:
+            # Only combos containing this key can have just become complete.
+            for combo, handler in self._hotkeys_by_key.get(norm, ()):
+                if combo <= pressed and combo not in self._active_hotkeys:
                     self._active_hotkeys.add(combo)
                     handlers_to_run.append(handler)
         if activate_focus:
             self._set_focus_overlay(True)
-        for handler in handlers_to_run:
+        if handlers_to_run:
+            # Handlers touch the widgets and restart listeners, so they run on the
+            # GUI thread and the listener thread returns straight away.
+            self._pending_hotkey_handlers.extend(handlers_to_run)
+            QMetaObject.invokeMethod(self, "_run_hotkey_handlers", Qt.QueuedConnection)
+
+    @Slot()
+    def _run_hotkey_handlers(self):
+        pending = self._pending_hotkey_handlers
+        while pending:
+            handler = pending.popleft()
             try:
                 handler()
             except Exception as exc:  # noqa: BLE001
                 print(f"Warning: hotkey handler raised an error: {exc}", file=sys.stderr)
 
     def _on_key_release(self, key):
-        norm = self._normalise_key(key)
+        norm = _normalise_key(key)
         deactivate_focus = False
         with self._lock:
             self._pressed_keys.discard(norm)
-            combos_to_clear = [
-                combo for combo in list(self._active_hotkeys) if not combo.issubset(self._pressed_keys)
-            ]
-            for combo in combos_to_clear:
-                self._active_hotkeys.discard(combo)
+            # Only combos containing this key can have just stopped being held.
+            self._active_hotkeys.difference_update(
+                [combo for combo, _handler in self._hotkeys_by_key.get(norm, ())]
+            )
             if (
                 self.focus_overlay_active
                 and self._focus_hotkey_set
-                and not self._focus_hotkey_set.issubset(self._pressed_keys)
+                and not self._focus_hotkey_set <= self._pressed_keys
             ):
                 deactivate_focus = True
         if deactivate_focus:
             self._set_focus_overlay(False)
 
     def _set_focus_overlay(self, active: bool):
-        desired = bool(active) and self.effect_flags.get("enable_focus_overlay", True)
+        desired = bool(active) and self._focus_overlay_enabled
         with self._lock:
             if self.focus_overlay_active == desired:
                 return
             self.focus_overlay_active = desired
             if not desired:
                 self._pressed_keys.clear()
-        self.update()
+        self._request_repaint()
 
     def _apply_flag_dependencies(self):
-        if not self.effect_flags.get("enable_painting", True):
-            self._cancel_active_stroke()
-            with self._lock:
+        # Mirrors of the flags checked on every mouse move or frame; every change
+        # to effect_flags is followed by a call to this method.
+        self._painting_enabled = bool(self.effect_flags.get("enable_painting", True))
+        self._cursor_tail_enabled = bool(self.effect_flags.get("enable_cursor_tail", True))
+        self._cursor_ring_enabled = bool(self.effect_flags.get("enable_cursor_ring", True))
+        self._focus_overlay_enabled = bool(self.effect_flags.get("enable_focus_overlay", True))
+        disabled_buttons = frozenset(
+            btn for btn in ("left", "right", "middle") if not self.effect_flags.get(f"enable_click_{btn}", True)
+        )
+        self._disabled_click_buttons = disabled_buttons
+        if (
+            self._painting_enabled
+            and self._cursor_tail_enabled
+            and self._focus_overlay_enabled
+            and not disabled_buttons
+        ):
+            return
+        repaint = False
+        # One critical section for everything a disabled effect leaves behind.
+        with self._lock:
+            if not self._painting_enabled:
+                self._cancel_active_stroke()
                 self.completed_strokes.clear()
-        if not self.effect_flags.get("enable_cursor_tail", True):
-            with self._lock:
-                self.cursor_tail.clear()
-        for btn in ("left", "right", "middle"):
-            if not self.effect_flags.get(f"enable_click_{btn}", True):
-                with self._lock:
-                    self.click_markers = [m for m in self.click_markers if m.button != btn]
+            if not self._cursor_tail_enabled:
+                self._clear_cursor_tail()
+            if disabled_buttons:
+                self._filter_click_markers(lambda marker: marker.button not in disabled_buttons)
+                for btn in disabled_buttons:
                     self._press_markers[btn] = None
-        if not self.effect_flags.get("enable_focus_overlay", True):
-            repaint = False
-            with self._lock:
+            if not self._focus_overlay_enabled:
                 if self.focus_overlay_active:
                     self.focus_overlay_active = False
                     repaint = True
                 self._pressed_keys.clear()
-            if repaint:
-                self.update()
+        if repaint:
+            self._request_repaint()
 
     def _notify_control_panel(self, message: Optional[str] = None):
         panel = getattr(self, "control_panel", None)
@@ -1705,7 +2258,13 @@ class ControlPanel(QWidget):
         self._allow_close = False
         self._tray_icon_supported = False
         self._tray_icon: Optional[QSystemTrayIcon] = None
+        self._tray_icon_cache: Dict[int, QIcon] = {}
         self._tray_message_shown = False
+        # (inode, mtime_ns, size) of the config file and the text last read from
+        # it. save_config swaps in a new file, so every save changes the inode even
+        # where the mtime resolution is too coarse to tell two saves apart.
+        self._config_text_cache: Optional[Tuple[Tuple[int, int, int], str]] = None
+        self._editor_text: Optional[str] = None
 
         self.setWindowTitle("Overlay Controls")
         self.setWindowFlag(Qt.Tool)
@@ -1803,7 +2362,7 @@ class ControlPanel(QWidget):
     def _apply_group_title(self, group: QGroupBox, hotkey_key: str):
         base = group.property("base_title") or group.title()
         spec = self.overlay.config.get(hotkey_key, "")
-        display = self._format_hotkey(spec)
+        display = _format_hotkey(spec)
         if display:
             group.setTitle(f"{base} ({display})")
         else:
@@ -1819,19 +2378,38 @@ class ControlPanel(QWidget):
         verb = "enabled" if enabled else "disabled"
         self._set_status(f"{label} {verb}", True)
 
-    def _refresh_config_editor(self, initial: bool = False):
+    def _read_config_text(self) -> str:
         try:
+            stat = os.stat(self.config_path)
+            stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            cached = self._config_text_cache
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
             text = self.config_path.read_text(encoding="utf-8")
         except OSError:
-            text = json.dumps(self.overlay.raw_config, indent=2)
-        with QSignalBlocker(self.config_editor):
-            self.config_editor.setPlainText(text)
-            self.config_editor.document().setModified(False)
+            self._config_text_cache = None
+            return self.overlay.raw_config_text()
+        self._config_text_cache = (stamp, text)
+        return text
+
+    def _refresh_config_editor(self, initial: bool = False):
+        text = self._read_config_text()
+        document = self.config_editor.document()
+        # Rebuilding the document is the expensive part; skip it when the editor
+        # still shows exactly this text.
+        if document.isModified() or text != self._editor_text:
+            with QSignalBlocker(self.config_editor):
+                self.config_editor.setPlainText(text)
+                document.setModified(False)
+            self._editor_text = text
         if initial:
             self._set_status("Config loaded", True)
         self._update_hotkey_titles()
 
     def _save_config_from_editor(self):
+        if not self.config_editor.document().isModified():
+            self._set_status("No changes to save", True)
+            return
         text = self.config_editor.toPlainText()
         try:
             raw = json.loads(text)
@@ -1848,6 +2426,7 @@ class ControlPanel(QWidget):
             return
 
         self.config_editor.document().setModified(False)
+        self._editor_text = None  # show the file as written, not the edited text
         self._sync_toggles_with_overlay()
         self._refresh_config_editor()
         self._set_status("Configuration saved", True)
@@ -1859,9 +2438,13 @@ class ControlPanel(QWidget):
             self._set_status(message, True)
 
     def _sync_toggles_with_overlay(self):
+        flags = self.overlay.effect_flags
         for key, checkbox in self.toggle_checks.items():
+            checked = bool(flags.get(key, True))
+            if checkbox.isChecked() == checked:
+                continue
             with QSignalBlocker(checkbox):
-                checkbox.setChecked(self.overlay.effect_flags.get(key, True))
+                checkbox.setChecked(checked)
 
     def _update_hotkey_titles(self):
         for hotkey_key, group in self.hotkey_groups.items():
@@ -1902,17 +2485,22 @@ class ControlPanel(QWidget):
         return True
 
     def _build_tray_icon(self) -> QIcon:
-        size = 64
+        base_color = self.overlay.config.get("cursor_ring_color")
+        color = QColor(base_color) if isinstance(base_color, QColor) else QColor(0, 180, 255)
+        color.setAlpha(255)
+        # The icon depends only on the ring color, so reuse it across config reloads.
+        cache_key = color.rgba()
+        cached = self._tray_icon_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        size = TRAY_ICON_SIZE
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.transparent)
 
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
-        base_color = self.overlay.config.get("cursor_ring_color")
-        color = QColor(base_color) if isinstance(base_color, QColor) else QColor(0, 180, 255)
-        color.setAlpha(255)
-
         center = pixmap.rect().center()
         radius = size // 3
 
@@ -1930,7 +2518,9 @@ class ControlPanel(QWidget):
 
         painter.end()
 
-        return QIcon(pixmap)
+        icon = QIcon(pixmap)
+        self._tray_icon_cache[cache_key] = icon
+        return icon
 
     def _show_from_tray(self):
         if self.isMinimized():
@@ -1961,22 +2551,6 @@ class ControlPanel(QWidget):
         self.status_label.setStyleSheet(f"color: {color};")
         self.status_label.setText(message)
 
-    @staticmethod
-    def _format_hotkey(spec: str) -> str:
-        if not spec:
-            return ""
-        cleaned = spec.replace("<", "").replace(">", "")
-        parts = [p.strip() for p in cleaned.split("+") if p.strip()]
-        if not parts:
-            return ""
-        formatted = []
-        for part in parts:
-            if len(part) == 1:
-                formatted.append(part.upper())
-            else:
-                formatted.append(part.capitalize())
-        return "+".join(formatted)
-
 
 def main():
     parser = argparse.ArgumentParser(description="Mouse overlay visualizer")
@@ -1990,6 +2564,7 @@ def main():
     config, raw_config = load_config(CONFIG_PATH)
     app = QApplication(sys.argv)
     overlay = OverlayWindow(config, raw_config, CONFIG_PATH)
+    overlay.app = app
     overlay.show()
     panel = None
     if not args.nogui: